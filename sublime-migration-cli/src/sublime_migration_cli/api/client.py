@@ -1,9 +1,12 @@
 """API client for Sublime Security Platform."""
 import os
 import time
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import Dict, List, Optional, Union, Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from sublime_migration_cli.api.regions import Region, get_region
 from sublime_migration_cli.utils.errors import (
@@ -12,12 +15,22 @@ from sublime_migration_cli.utils.errors import (
     ResourceNotFoundError,
     handle_api_error
 )
+from sublime_migration_cli.utils.rate_limit import TokenBucket
+from sublime_migration_cli.utils.serialization import json_dumps, json_loads
+
+
+# Upper bound on how long a server-provided Retry-After may delay a retry
+MAX_RETRY_AFTER = 60.0
+
+# Maximum number of clients kept for reuse by get_cached_api_client
+CLIENT_CACHE_SIZE = 16
 
 
 class ApiClient:
     """Client for interacting with the Sublime Security API."""
 
-    def __init__(self, api_key: str, region_code: str, max_retries: int = 3, retry_delay: float = 1.0):
+    def __init__(self, api_key: str, region_code: str, max_retries: int = 3, retry_delay: float = 1.0,
+                 rate_limiter: Optional[TokenBucket] = None):
         """Initialize API client.
 
         Args:
@@ -25,12 +38,30 @@ class ApiClient:
             region_code: Region code to connect to
             max_retries: Maximum number of retry attempts for transient errors
             retry_delay: Base delay between retries (will be exponentially increased)
+            rate_limiter: Optional limiter shared by all requests, including retries
         """
         self.api_key = api_key
         self.region = get_region(region_code)
         self.base_url = self.region.api_url
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.rate_limiter = rate_limiter
+        self.session = self._create_session()
+        
+    def _create_session(self) -> requests.Session:
+        """Create a session that keeps connections to the API alive between requests.
+        
+        Retries are handled by _make_request, so the adapter does not retry.
+        
+        Returns:
+            requests.Session: Session with pooled connections and auth headers
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(self._get_headers())
+        return session
         
     def _get_headers(self) -> Dict[str, str]:
         """Create request headers with auth token.
@@ -46,9 +77,10 @@ class ApiClient:
     
     def _make_request(self, method: str, endpoint: str, 
                      params: Optional[Dict] = None, 
-                     data: Optional[Dict] = None,
-                     json: Optional[Dict] = None,
-                     retry_on_codes: Optional[List[int]] = None) -> Dict:
+                     data: Optional[Union[Dict, bytes]] = None,
+                     json: Optional[Union[Dict, List]] = None,
+                     retry_on_codes: Optional[List[int]] = None,
+                     retry_errors: bool = True) -> Dict:
         """
         Make an HTTP request to the API with retries for transient errors.
         
@@ -56,9 +88,12 @@ class ApiClient:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint (without base URL)
             params: Optional query parameters
-            data: Optional request body (form data)
-            json: Optional request body (JSON)
+            data: Optional request body (form data or encoded bytes)
+            json: Optional request body (JSON), takes precedence over data
             retry_on_codes: HTTP status codes to retry on
+            retry_errors: Whether to retry on connection errors, timeouts, other
+                error statuses and undecodable responses; disable for requests
+                that must not be replayed once the server may have processed them
             
         Returns:
             Dict: Response data
@@ -70,24 +105,33 @@ class ApiClient:
             retry_on_codes = [429, 500, 502, 503, 504]
         
         url = f"{self.base_url}{endpoint}"
-        headers = self._get_headers()
+        
+        # Serialize JSON bodies once up front rather than on every attempt;
+        # the session already sends the JSON Content-Type header
+        if json is not None:
+            data = json_dumps(json)
         
         for attempt in range(self.max_retries):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            
             try:
-                response = requests.request(
+                response = self.session.request(
                     method=method,
                     url=url,
-                    headers=headers,
                     params=params,
                     data=data,
-                    json=json,
                     timeout=(10, 30)  # (connect_timeout, read_timeout)
                 )
                 
                 # Check if we got a retryable status code
                 if response.status_code in retry_on_codes and attempt < self.max_retries - 1:
-                    # Calculate exponential backoff with jitter
+                    # Calculate exponential backoff with jitter, waiting at least
+                    # as long as the server asked for (e.g. on 429 or 503)
                     delay = self.retry_delay * (2 ** attempt) * (0.8 + 0.4 * (time.time() % 1))
+                    retry_after = self._get_retry_after(response)
+                    if retry_after is not None:
+                        delay = max(delay, retry_after)
                     time.sleep(delay)
                     continue
                     
@@ -95,7 +139,7 @@ class ApiClient:
                 response.raise_for_status()
                 
                 # Return the JSON response for success
-                return response.json()
+                return json_loads(response.content)
                 
             except (requests.exceptions.RequestException, ValueError) as e:
                 # Don't retry on client errors (4xx, except those in retry_on_codes)
@@ -104,8 +148,8 @@ class ApiClient:
                     if status_code // 100 == 4 and status_code not in retry_on_codes:
                         raise handle_api_error(e)
                     
-                # On the last attempt, raise the error
-                if attempt >= self.max_retries - 1:
+                # On the last attempt, or if errors must not be retried, raise the error
+                if not retry_errors or attempt >= self.max_retries - 1:
                     raise handle_api_error(e)
                 
                 # For other errors, retry with backoff
@@ -115,6 +159,32 @@ class ApiClient:
         # This should not be reached, but just in case
         raise ApiError("Maximum retry attempts exceeded")
         
+    @staticmethod
+    def _get_retry_after(response: requests.Response) -> Optional[float]:
+        """Read the delay requested by the server's Retry-After header.
+        
+        Args:
+            response: Response to inspect
+            
+        Returns:
+            Optional[float]: Seconds to wait (capped at MAX_RETRY_AFTER), or None
+                if the header is missing or invalid
+        """
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        
+        # Retry-After is either a number of seconds or an HTTP date
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        
+        return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+        
     def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
         """Make a GET request to the API.
         
@@ -145,6 +215,27 @@ class ApiClient:
         """
         return self._make_request("POST", endpoint, json=data)
 
+    def post_bulk(self, endpoint: str, items: List[Dict]) -> Any:
+        """Make a POST request to a bulk API endpoint.
+        
+        The request is only retried on 429, which the server answers without
+        processing it. Other failures are raised at once, since replaying a
+        bulk request that may have been applied could create duplicates.
+        
+        Args:
+            endpoint: API endpoint (without base URL)
+            items: List of item payloads sent as a JSON array
+            
+        Returns:
+            Any: Response data
+            
+        Raises:
+            ApiError: If the request fails
+        """
+        return self._make_request(
+            "POST", endpoint, json=items, retry_on_codes=[429], retry_errors=False
+        )
+
     def patch(self, endpoint: str, data: Dict) -> Dict:
         """Make a PATCH request to the API.
         
@@ -218,4 +309,28 @@ def get_api_client_from_env_or_args(api_key: Optional[str] = None,
             f"Region not provided. Use --region option or set SUBLIME_REGION environment variable."
         )
     
-    return ApiClient(api_key=api_key, region_code=region, max_retries=max_retries)
\ No newline at end of file
+    return ApiClient(api_key=api_key, region_code=region, max_retries=max_retries)
+
+
+@lru_cache(maxsize=CLIENT_CACHE_SIZE)
+def get_cached_api_client(api_key: Optional[str] = None, 
+                          region: Optional[str] = None, 
+                          destination: Optional[bool] = False) -> ApiClient:
+    """Get an API client using environment variables or args, reusing clients.
+    
+    Clients are cached per (api_key, region, destination), so repeated lookups
+    for the same instance share one session and its open connections instead
+    of setting up new ones. Callers must not reconfigure the returned client.
+    
+    Args:
+        api_key: API key from command-line args (optional)
+        region: Region code from command-line args (optional)
+        destination: Whether this is for a destination instance
+        
+    Returns:
+        ApiClient: Configured API client
+        
+    Raises:
+        ValueError: If API key or region is not provided
+    """
+    return get_api_client_from_env_or_args(api_key, region, destination=destination)
@@ -3,7 +3,7 @@ from typing import Dict, List, Optional, Set
 import click
 
 from sublime_migration_cli.api.client import get_api_client_from_env_or_args
-from sublime_migration_cli.presentation.base import CommandResult
+from sublime_migration_cli.presentation.base import CommandResult, auto_confirm
 from sublime_migration_cli.presentation.factory import create_formatter
 
 # Import our utility functions
@@ -272,23 +272,15 @@ def exclusions(source_api_key, source_region, dest_api_key, dest_region,
     # Create formatter based on output format
     formatter = create_formatter(output_format)
     
-    # If --yes flag is provided, modify the formatter to auto-confirm
-    if yes:
-        original_prompt = formatter.prompt_confirmation
-        formatter.prompt_confirmation = lambda _: True
-    
-    # Execute the implementation function
-    result = migrate_exclusions_between_instances(
-        source_api_key, source_region, 
-        dest_api_key, dest_region,
-        include_ids, exclude_ids, 
-        include_system_created,
-        dry_run, formatter
-    )
-    
-    # Reset the formatter if it was modified
-    if yes and hasattr(formatter, 'original_prompt'):
-        formatter.prompt_confirmation = original_prompt
+    # Execute the implementation function, auto-confirming if --yes was provided
+    with auto_confirm(formatter, yes):
+        result = migrate_exclusions_between_instances(
+            source_api_key, source_region, 
+            dest_api_key, dest_region,
+            include_ids, exclude_ids, 
+            include_system_created,
+            dry_run, formatter
+        )
     
     # Output the result
     formatter.output_result(result)
\ No newline at end of file
@@ -1,27 +1,50 @@
 """Migration command for applying rule-level exclusions."""
+from collections import defaultdict
+from functools import lru_cache
 from typing import Dict, List, Optional, Set, Tuple
-import re
+import sys
 import click
 
+# Prefer RE2 (linear-time matching) for exclusion parsing when it is installed
+try:
+    import re2 as re
+except ImportError:
+    import re
+
 from sublime_migration_cli.api.client import get_api_client_from_env_or_args
-from sublime_migration_cli.presentation.base import CommandResult
+from sublime_migration_cli.presentation.base import CommandResult, auto_confirm
 from sublime_migration_cli.presentation.factory import create_formatter
 
 # Import our utility functions
 from sublime_migration_cli.utils.api import PaginatedFetcher
 from sublime_migration_cli.utils.filtering import filter_by_ids
 from sublime_migration_cli.utils.errors import (
-    ApiError, MigrationError, handle_api_error, ErrorHandler
+    ApiError, MigrationError, SublimeError, handle_api_error, ErrorHandler
+)
+
+
+# Single alternation over the supported exclusion formats; the named group
+# that matched identifies the exclusion type
+EXCLUSION_PATTERN = re.compile(
+    r"any\(recipients\.to, \.email\.email == '(?P<recipient_email>[^']+)'\)"
+    r"|sender\.email\.email == '(?P<sender_email>[^']+)'"
+    r"|sender\.email\.domain\.domain == '(?P<sender_domain>[^']+)'"
 )
 
+# Destination rule fields needed to match and update rules
+DEST_RULE_FIELDS = ("id", "name", "source_md5")
 
-# Regular expression patterns for different types of exclusions
-EXCLUSION_PATTERNS = {
-    "recipient_email": re.compile(r"any\(recipients\.to, \.email\.email == '([^']+)'\)"),
-    "sender_email": re.compile(r"sender\.email\.email == '([^']+)'"),
-    "sender_domain": re.compile(r"sender\.email\.domain\.domain == '([^']+)'")
+# Exclusion text stored on rules for each exclusion type, matching EXCLUSION_PATTERN
+EXCLUSION_TEMPLATES = {
+    "recipient_email": "any(recipients.to, .email.email == '{value}')",
+    "sender_email": "sender.email.email == '{value}'",
+    "sender_domain": "sender.email.domain.domain == '{value}'",
 }
 
+# Status codes on which a bulk exclusion update falls back to adding exclusions
+# one by one: the destination either lacks the update or rejects the payload
+BULK_FALLBACK_STATUS_CODES = (400, 404, 405, 422)
+
 
 # Implementation functions
 def migrate_rule_exclusions_between_instances(
@@ -76,16 +99,20 @@ def migrate_rule_exclusions_between_instances(
                 
         # Fetch all rules from destination to build match map
         dest_fetcher = PaginatedFetcher(dest_client, formatter)
-        dest_rules = dest_fetcher.fetch_all(
+        # Index destination rules by name and source_md5 page by page, keeping
+        # only the fields needed for matching and updating
+        dest_rules_map = {}
+        for page in dest_fetcher.iter_pages(
             "/v1/rules",
+            params={"fields": ",".join(DEST_RULE_FIELDS)},
             progress_message="Fetching rules from destination..."
-        )
-        
-        # Create mapping of destination rules by name and source_md5
-        dest_rules_map = {
-            (rule.get("name"), rule.get("source_md5")): rule 
-            for rule in dest_rules
-        }
+        ):
+            dest_rules_map.update(
+                (rule_match_key(rule.get("name"), rule.get("source_md5")), {
+                    field: rule.get(field) for field in DEST_RULE_FIELDS
+                })
+                for rule in page
+            )
         
         # Match rule exclusions to destination rules
         matching_results = match_exclusions_to_rules(
@@ -104,29 +131,27 @@ def migrate_rule_exclusions_between_instances(
             
         # Prepare response data
         total_exclusions = len(exclusions_to_apply)
-        # Group exclusions by rule
-        exclusions_by_rule = {}
-        for exclusion in exclusions_to_apply:
-            rule_id = exclusion["dest_rule"]["id"]
-            rule_name = exclusion["dest_rule"]["name"]
-            if rule_id not in exclusions_by_rule:
-                exclusions_by_rule[rule_id] = {
-                    "rule_name": rule_name,
+        exclusions_by_rule = group_exclusions_by_rule(exclusions_to_apply)
+        
+        migration_data = {
+            "rules_to_update": [
+                {
+                    "rule_name": rule_data["rule"]["name"],
                     "rule_id": rule_id,
-                    "exclusions": [],
+                    "exclusions": [
+                        f"{exclusion_type}: {value}"
+                        for exclusion_type, values in rule_data["exclusions"].items()
+                        for value in values
+                    ],
                     "status": "Update"
                 }
-            exclusions_by_rule[rule_id]["exclusions"].append(
-                f"{exclusion['exclusion_type']}: {exclusion['exclusion_value']}"
-            )
-        
-        migration_data = {
-            "rules_to_update": list(exclusions_by_rule.values()),
+                for rule_id, rule_data in exclusions_by_rule.items()
+            ],
             "skipped_exclusions": [
                 {
-                    "rule_name": item.get("originating_rule", {}).get("name", "Unknown"),
-                    "exclusion": item.get("source", ""),
-                    "reason": item.get("reason", "Unknown reason")
+                    "rule_name": (item["originating_rule"] or {}).get("name", "Unknown"),
+                    "exclusion": item["source"],
+                    "reason": item["reason"]
                 }
                 for item in skipped_exclusions
             ]
@@ -160,7 +185,7 @@ def migrate_rule_exclusions_between_instances(
             return CommandResult.success("Migration canceled by user.")
         
         # Perform the migration
-        results = apply_rule_exclusions(formatter, dest_client, exclusions_to_apply)
+        results = apply_rule_exclusions(formatter, dest_client, exclusions_by_rule)
         
         # Add results to migration data
         migration_data["results"] = results
@@ -196,25 +221,29 @@ def filter_rule_exclusions_by_rule_ids(exclusions: List[Dict], include_rule_ids:
     include_ids = set(id.strip() for id in include_rule_ids.split(",")) if include_rule_ids else None
     exclude_ids = set(id.strip() for id in exclude_rule_ids.split(",")) if exclude_rule_ids else None
     
-    filtered_exclusions = []
+    # Exclusions without an originating rule are always dropped
+    return [
+        exclusion for exclusion in exclusions
+        if (originating_rule := exclusion.get("originating_rule"))
+        and (not include_ids or originating_rule.get("id") in include_ids)
+        and (not exclude_ids or originating_rule.get("id") not in exclude_ids)
+    ]
+
+
+def rule_match_key(name: Optional[str], source_md5: Optional[str]) -> str:
+    """Build the key used to match rules across instances.
     
-    for exclusion in exclusions:
-        if not exclusion.get("originating_rule"):
-            # Skip if no originating rule
-            continue
-            
-        rule_id = exclusion["originating_rule"].get("id")
-        
-        # Apply filters
-        if include_ids and rule_id not in include_ids:
-            continue
-            
-        if exclude_ids and rule_id in exclude_ids:
-            continue
-            
-        filtered_exclusions.append(exclusion)
+    A single string hashes faster than a (name, source_md5) tuple; the NUL
+    separator cannot appear in either part, so keys cannot collide.
     
-    return filtered_exclusions
+    Args:
+        name: Rule name
+        source_md5: MD5 hash of the rule source
+        
+    Returns:
+        str: Match key for the rule
+    """
+    return f"{source_md5}\x00{name}"
 
 
 def match_exclusions_to_rules(source_exclusions: List[Dict], dest_rules_map: Dict) -> Dict:
@@ -222,7 +251,7 @@ def match_exclusions_to_rules(source_exclusions: List[Dict], dest_rules_map: Dic
     
     Args:
         source_exclusions: List of source rule exclusions
-        dest_rules_map: Map of destination rules by (name, source_md5)
+        dest_rules_map: Map of destination rules by rule_match_key(name, source_md5)
         
     Returns:
         Dict: Results of matching
@@ -230,13 +259,18 @@ def match_exclusions_to_rules(source_exclusions: List[Dict], dest_rules_map: Dic
     exclusions_to_apply = []
     skipped_exclusions = []
     
+    # Exclusions cluster per rule, so remember each originating rule's match (or
+    # miss) as a slim reference shared by all of that rule's exclusions
+    dest_rule_cache: Dict[str, Optional[Dict]] = {}
+    
     for exclusion in source_exclusions:
         # Get originating rule details
         originating_rule = exclusion.get("originating_rule")
         
         if not originating_rule:
             skipped_exclusions.append({
-                **exclusion,
+                "originating_rule": originating_rule,
+                "source": exclusion.get("source", ""),
                 "reason": "No originating rule information found"
             })
             continue
@@ -244,12 +278,30 @@ def match_exclusions_to_rules(source_exclusions: List[Dict], dest_rules_map: Dic
         rule_name = originating_rule.get("name")
         rule_md5 = originating_rule.get("source_md5")
         
+        # Rules without a name or source_md5 (e.g. ad-hoc rules) can never match
+        if not rule_name or not rule_md5:
+            skipped_exclusions.append({
+                "originating_rule": originating_rule,
+                "source": exclusion.get("source", ""),
+                "reason": "Missing name or source_md5"
+            })
+            continue
+        
         # Find matching rule in destination
-        dest_rule = dest_rules_map.get((rule_name, rule_md5))
+        originating_rule_id = originating_rule.get("id")
+        if originating_rule_id in dest_rule_cache:
+            dest_rule = dest_rule_cache[originating_rule_id]
+        else:
+            dest_rule = dest_rules_map.get(rule_match_key(rule_name, rule_md5))
+            if dest_rule:
+                dest_rule = {"id": dest_rule["id"], "name": dest_rule["name"]}
+            if originating_rule_id is not None:
+                dest_rule_cache[originating_rule_id] = dest_rule
         
         if not dest_rule:
             skipped_exclusions.append({
-                **exclusion,
+                "originating_rule": originating_rule,
+                "source": exclusion.get("source", ""),
                 "reason": "No matching rule found in destination (name and source_md5 must match)"
             })
             continue
@@ -260,14 +312,14 @@ def match_exclusions_to_rules(source_exclusions: List[Dict], dest_rules_map: Dic
         
         if not parsed_exclusion:
             skipped_exclusions.append({
-                **exclusion,
+                "originating_rule": originating_rule,
+                "source": exclusion.get("source", ""),
                 "reason": "Could not parse exclusion format"
             })
             continue
             
         # Add to list of exclusions to apply
         exclusions_to_apply.append({
-            "source_exclusion": exclusion,
             "dest_rule": dest_rule,
             "exclusion_type": parsed_exclusion[0],
             "exclusion_value": parsed_exclusion[1]
@@ -279,30 +331,61 @@ def match_exclusions_to_rules(source_exclusions: List[Dict], dest_rules_map: Dic
     }
 
 
+@lru_cache(maxsize=4096)
 def parse_exclusion_string(exclusion_str: str) -> Optional[Tuple[str, str]]:
     """Parse an exclusion string to determine its type.
     
+    Results are cached since the same exclusion text commonly recurs
+    across rules (e.g. organization-wide allowlists).
+    
     Args:
         exclusion_str: Exclusion string from the rule
         
     Returns:
         Optional[Tuple[str, str]]: Exclusion type and value, or None if not recognized
     """
-    for exc_type, pattern in EXCLUSION_PATTERNS.items():
-        match = pattern.search(exclusion_str)
-        if match:
-            return (exc_type, match.group(1))
+    # Every supported format compares against a quoted literal, so skip the
+    # regex entirely for strings that can't match
+    if "== '" not in exclusion_str:
+        return None
     
-    return None
+    match = EXCLUSION_PATTERN.search(exclusion_str)
+    if not match:
+        return None
+    
+    # Intern the type so every parsed exclusion shares one string per type,
+    # whichever regex engine produced the group name
+    exclusion_type = sys.intern(match.lastgroup)
+    return (exclusion_type, match.group(exclusion_type))
 
 
-def apply_rule_exclusions(formatter, dest_client, exclusions_to_apply: List[Dict]) -> Dict:
+def group_exclusions_by_rule(exclusions_to_apply: List[Dict]) -> Dict[str, Dict]:
+    """Group matched exclusions by destination rule and exclusion type.
+    
+    Args:
+        exclusions_to_apply: List of exclusions to apply with rule information
+        
+    Returns:
+        Dict[str, Dict]: Map of destination rule ID to the rule and its
+            exclusion values keyed by exclusion type
+    """
+    exclusions_by_rule = defaultdict(lambda: {"rule": None, "exclusions": defaultdict(list)})
+    for exclusion in exclusions_to_apply:
+        rule_data = exclusions_by_rule[exclusion["dest_rule"]["id"]]
+        rule_data["rule"] = exclusion["dest_rule"]
+        rule_data["exclusions"][exclusion["exclusion_type"]].append(exclusion["exclusion_value"])
+    
+    return exclusions_by_rule
+
+
+def apply_rule_exclusions(formatter, dest_client, exclusions_by_rule: Dict[str, Dict]) -> Dict:
     """Apply exclusions to rules in the destination.
     
     Args:
         formatter: Output formatter
         dest_client: API client for the destination
-        exclusions_to_apply: List of exclusions to apply with rule information
+        exclusions_by_rule: Exclusions grouped by destination rule, as returned
+            by group_exclusions_by_rule
         
     Returns:
         Dict: Migration results
@@ -314,19 +397,6 @@ def apply_rule_exclusions(formatter, dest_client, exclusions_to_apply: List[Dict
         "details": []
     }
     
-    # Group exclusions by rule for efficient updates
-    exclusions_by_rule = {}
-    for exclusion in exclusions_to_apply:
-        rule_id = exclusion["dest_rule"]["id"]
-        if rule_id not in exclusions_by_rule:
-            exclusions_by_rule[rule_id] = {
-                "rule": exclusion["dest_rule"],
-                "exclusions": []
-            }
-        exclusions_by_rule[rule_id]["exclusions"].append({
-            exclusion["exclusion_type"]: exclusion["exclusion_value"]
-        })
-    
     with formatter.create_progress("Updating rule exclusions...", total=len(exclusions_by_rule)) as (progress, task):
         for i, (rule_id, rule_data) in enumerate(exclusions_by_rule.items()):
             rule = rule_data["rule"]
@@ -341,42 +411,65 @@ def apply_rule_exclusions(formatter, dest_client, exclusions_to_apply: List[Dict
     return results
 
 
-def process_rule_exclusion_update(rule: Dict, exclusions: List[Dict], dest_client, results: Dict):
+def process_rule_exclusion_update(rule: Dict, exclusions: Dict[str, List[str]], dest_client, results: Dict):
     """Process rule exclusion updates for a single rule.
     
+    The rule's current exclusions are fetched and merged with the new ones, and
+    the merged list is sent in a single PATCH. Exclusions the PATCH is rejected
+    for (BULK_FALLBACK_STATUS_CODES), or that are missing from the rule when it
+    is read back, are added one by one instead. Rules that already have every
+    exclusion are reported as skipped.
+    
     Args:
         rule: Rule to update
-        exclusions: List of exclusions to apply to the rule
+        exclusions: Exclusion values to apply to the rule, keyed by exclusion type
         dest_client: API client for the destination
         results: Results dictionary to update
     """
     rule_name = rule.get("name", "")
     rule_id = rule.get("id", "")
     
+    # Flatten to (type, value) pairs, the form the add-exclusion endpoint takes
+    requested = list(dict.fromkeys(
+        (exclusion_type, value)
+        for exclusion_type, values in exclusions.items()
+        for value in values
+    ))
+    
     try:
-        # Apply each exclusion one by one
-        succeeded = 0
-        for exclusion in exclusions:
-            try:
-                # Add exclusion to rule
-                dest_client.post(f"/v1/rules/{rule_id}/add-exclusion", exclusion)
-                succeeded += 1
-            except ApiError as e:
-                # Record failure but continue with others
-                results["details"].append({
-                    "name": rule_name,
-                    "type": "exclusion",
-                    "status": "failed",
-                    "reason": f"Failed to add exclusion {exclusion}: {e.message}"
-                })
-            except Exception as e:
-                sublime_error = handle_api_error(e)
-                results["details"].append({
-                    "name": rule_name,
-                    "type": "exclusion",
-                    "status": "failed",
-                    "reason": f"Failed to add exclusion {exclusion}: {sublime_error.message}"
-                })
+        # PATCH replaces the exclusions, so merge with those already on the rule
+        current_exclusions = list(fetch_rule_exclusions(dest_client, rule_id))
+        current_pairs = parse_exclusion_pairs(current_exclusions)
+        to_add = [pair for pair in requested if pair not in current_pairs]
+        
+        if not to_add:
+            results["skipped"] += 1
+            results["details"].append({
+                "name": rule_name,
+                "type": "rule",
+                "status": "skipped",
+                "reason": "All exclusions already exist on the rule"
+            })
+            return
+        
+        missing = to_add
+        merged = current_exclusions + [format_exclusion(*pair) for pair in to_add]
+        try:
+            dest_client.patch(f"/v1/rules/{rule_id}", {"exclusions": merged})
+        except ApiError as e:
+            if e.status_code not in BULK_FALLBACK_STATUS_CODES:
+                raise
+        else:
+            # Re-read the rule rather than relying on the PATCH response body,
+            # and only count exclusions it actually has
+            applied = parse_exclusion_pairs(fetch_rule_exclusions(dest_client, rule_id))
+            missing = [pair for pair in to_add if pair not in applied]
+        
+        succeeded = len(to_add) - len(missing)
+        if missing:
+            succeeded += add_rule_exclusions_individually(
+                rule_name, rule_id, missing, dest_client, results
+            )
         
         if succeeded > 0:
             results["updated"] += 1
@@ -414,6 +507,92 @@ def process_rule_exclusion_update(rule: Dict, exclusions: List[Dict], dest_clien
         })
 
 
+def fetch_rule_exclusions(dest_client, rule_id: str) -> List[str]:
+    """Fetch the exclusions currently set on a destination rule.
+    
+    Args:
+        dest_client: API client for the destination
+        rule_id: ID of the rule
+        
+    Returns:
+        List[str]: The rule's exclusion strings
+    """
+    rule = dest_client.get(f"/v1/rules/{rule_id}")
+    if not isinstance(rule, dict):
+        return []
+    return rule.get("exclusions") or []
+
+
+def format_exclusion(exclusion_type: str, value: str) -> str:
+    """Format an exclusion as the rule exclusion text stored on rules.
+    
+    Args:
+        exclusion_type: Exclusion type, a key of EXCLUSION_TEMPLATES
+        value: Exclusion value
+        
+    Returns:
+        str: Exclusion text, which parse_exclusion_string maps back to the same pair
+    """
+    return EXCLUSION_TEMPLATES[exclusion_type].format(value=value)
+
+
+def parse_exclusion_pairs(exclusion_strings: List[str]) -> Set[Tuple[str, str]]:
+    """Parse rule exclusion strings into (type, value) pairs.
+    
+    Strings in formats that can't be parsed are ignored.
+    
+    Args:
+        exclusion_strings: Exclusion strings from a rule
+        
+    Returns:
+        Set[Tuple[str, str]]: Parsed exclusion types and values
+    """
+    pairs = set()
+    for exclusion_str in exclusion_strings:
+        if isinstance(exclusion_str, str):
+            parsed = parse_exclusion_string(exclusion_str)
+            if parsed:
+                pairs.add(parsed)
+    return pairs
+
+
+def add_rule_exclusions_individually(rule_name: str, rule_id: str, exclusions: List[Tuple[str, str]],
+                                     dest_client, results: Dict) -> int:
+    """Add exclusions to a rule one at a time via the add-exclusion endpoint.
+    
+    Args:
+        rule_name: Name of the rule being updated
+        rule_id: ID of the rule being updated
+        exclusions: Exclusion types and values to add to the rule
+        dest_client: API client for the destination
+        results: Results dictionary to record failures in
+        
+    Returns:
+        int: Number of exclusions successfully added
+    """
+    succeeded = 0
+    for exclusion_type, value in exclusions:
+        try:
+            # Add exclusion to rule
+            dest_client.post(f"/v1/rules/{rule_id}/add-exclusion", {exclusion_type: value})
+            succeeded += 1
+        except Exception as e:
+            # Client errors are already converted; only wrap unexpected ones
+            error = e if isinstance(e, SublimeError) else handle_api_error(e)
+            # Record failure but continue with others; the reason is only
+            # formatted by the output formatter if it is displayed
+            results["details"].append({
+                "name": rule_name,
+                "type": "exclusion",
+                "status": "failed",
+                "exclusion_type": exclusion_type,
+                "exclusion_value": value,
+                "error": error.message
+            })
+    
+    return succeeded
+
+
 # Click command definition
 @click.command()
 @click.option("--source-api-key", help="API key for the source instance")
@@ -449,22 +628,14 @@ def rule_exclusions(source_api_key, source_region, dest_api_key, dest_region,
     # Create formatter based on output format
     formatter = create_formatter(output_format)
     
-    # If --yes flag is provided, modify the formatter to auto-confirm
-    if yes:
-        original_prompt = formatter.prompt_confirmation
-        formatter.prompt_confirmation = lambda _: True
-    
-    # Execute the implementation function
-    result = migrate_rule_exclusions_between_instances(
-        source_api_key, source_region, 
-        dest_api_key, dest_region,
-        include_rule_ids, exclude_rule_ids,
-        dry_run, formatter
-    )
-    
-    # Reset the formatter if it was modified
-    if yes and hasattr(formatter, 'original_prompt'):
-        formatter.prompt_confirmation = original_prompt
+    # Execute the implementation function, auto-confirming if --yes was provided
+    with auto_confirm(formatter, yes):
+        result = migrate_rule_exclusions_between_instances(
+            source_api_key, source_region, 
+            dest_api_key, dest_region,
+            include_rule_ids, exclude_rule_ids,
+            dry_run, formatter
+        )
     
     # Output the result
     formatter.output_result(result)
\ No newline at end of file
@@ -1,26 +1,92 @@
 """Refactored commands for migrating rules using utility functions."""
-from typing import Dict, List, Optional, Set
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set
+import threading
 import click
 
 from sublime_migration_cli.api.client import get_api_client_from_env_or_args
-from sublime_migration_cli.presentation.base import CommandResult
+from sublime_migration_cli.presentation.base import CommandResult, auto_confirm
 from sublime_migration_cli.presentation.factory import create_formatter
 
 # Import our utility functions
 from sublime_migration_cli.utils.api import PaginatedFetcher
-from sublime_migration_cli.utils.filtering import filter_by_ids
+from sublime_migration_cli.utils.filtering import filter_by_id_sets, parse_id_set
+from sublime_migration_cli.utils.rate_limit import TokenBucket
+from sublime_migration_cli.utils.serialization import content_digest
 from sublime_migration_cli.utils.errors import (
     ApiError, MigrationError, handle_api_error, ErrorHandler
 )
 
 
+# Default number of rules sent to the destination concurrently
+DEFAULT_CONCURRENCY = 8
+
+# Bulk rule creation endpoint and the number of rules sent per request
+BULK_CREATE_ENDPOINT = "/v1/rules:batchCreate"
+BULK_BATCH_SIZE = 50
+
+# Status codes indicating the destination does not support bulk rule creation
+BULK_UNSUPPORTED_STATUS_CODES = (404, 405)
+
+# Status codes indicating some rules in a bulk request already exist
+BULK_CONFLICT_STATUS_CODES = (409,)
+
+# Keys a bulk create response object may hold its per-item results under
+BULK_RESULT_KEYS = ("results", "rules", "items")
+
+# Per-item statuses marking a rule the bulk endpoint did not create
+BULK_FAILED_STATUSES = frozenset({"failed", "error", "rejected"})
+
+# Query parameters used to look up destination rules after an unknown bulk outcome
+DEST_RULE_LOOKUP_PARAMS = {"include_deleted": "false", "in_feed": "false"}
+
+# Rule fields copied to the destination payload only when set on the source rule
+OPTIONAL_RULE_FIELDS = (
+    "attack_types", "auto_review_auto_share", "auto_review_classification",
+    "detection_methods", "false_positives", "maturity", "references",
+    "severity", "tactics_and_techniques", "tags", "user_provided_tags",
+    "triage_abuse_reports", "triage_flagged_messages"
+)
+
+
+class RuleView(NamedTuple):
+    """Frequently read fields of a source rule, extracted once."""
+    id: str
+    name: str
+    type: str
+    severity: str
+    source_md5: Optional[str]
+    rule: Dict
+
+    @classmethod
+    def from_rule(cls, rule: Dict) -> "RuleView":
+        """Create a view of a source rule.
+        
+        Args:
+            rule: Source rule object
+            
+        Returns:
+            RuleView: View of the rule
+        """
+        return cls(
+            id=rule.get("id", ""),
+            name=rule.get("name", ""),
+            type=rule.get("type", ""),
+            severity=rule.get("severity", ""),
+            source_md5=rule.get("source_md5"),
+            rule=rule
+        )
+
+
 # Implementation functions
 def migrate_rules_between_instances(
     source_api_key=None, source_region=None, 
     dest_api_key=None, dest_region=None,
     include_rule_ids=None, exclude_rule_ids=None, 
     rule_type=None,
-    dry_run=False, formatter=None
+    dry_run=False, formatter=None,
+    concurrency=DEFAULT_CONCURRENCY, rate_limit=None
 ):
     """Implementation for migrating rules between instances.
     
@@ -34,6 +100,9 @@ def migrate_rules_between_instances(
         rule_type: Filter by rule type (detection or triage)
         dry_run: If True, preview changes without applying them
         formatter: Output formatter
+        concurrency: Maximum number of rules sent to the destination at once
+        rate_limit: Maximum requests per second sent to the destination, or
+            None for no limit
     """
     # Default to table formatter if none provided
     if formatter is None:
@@ -44,8 +113,15 @@ def migrate_rules_between_instances(
         with formatter.create_progress("Connecting to source and destination instances...") as (progress, task):
             source_client = get_api_client_from_env_or_args(source_api_key, source_region)
             dest_client = get_api_client_from_env_or_args(dest_api_key, dest_region, destination=True)
+            if rate_limit:
+                # One bucket shared by all workers paces the destination as a whole
+                dest_client.rate_limiter = TokenBucket(rate_limit)
             progress.update(task, advance=1)
         
+        # Parse the ID filters once up front
+        include_ids = parse_id_set(include_rule_ids)
+        exclude_ids = parse_id_set(exclude_rule_ids)
+        
         # Build query parameters for filtering
         params = {
             "include_deleted": "false",
@@ -55,30 +131,29 @@ def migrate_rules_between_instances(
         if rule_type:
             params["type"] = rule_type
         
-        # Use PaginatedFetcher to fetch all rules from source with pagination
-        source_fetcher = PaginatedFetcher(source_client, formatter)
-        source_rules = source_fetcher.fetch_all(
-            "/v1/rules",
-            params=params,
-            progress_message="Fetching rules from source..."
-        )
+        # Fetch all rules from source and destination concurrently. Only one
+        # progress display can be live at a time, so both share a single one.
+        # Destination rules are indexed as they stream in rather than kept.
+        source_fetcher = PaginatedFetcher(source_client)
+        dest_fetcher = PaginatedFetcher(dest_client)
+        with formatter.create_progress("Fetching rules from source and destination...") as (progress, task):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                source_future = executor.submit(source_fetcher.fetch_all, "/v1/rules", params=params)
+                dest_future = executor.submit(
+                    lambda: index_dest_rules(dest_fetcher.fetch_iter("/v1/rules", params=params))
+                )
+                source_rules = source_future.result()
+                dest_by_name = dest_future.result()
+            progress.update(task, advance=1)
         
         # Apply ID filters using our utility function
-        filtered_rules = filter_by_ids(source_rules, include_rule_ids, exclude_rule_ids)
+        filtered_rules = filter_by_id_sets(source_rules, include_ids, exclude_ids)
         
         if not filtered_rules:
             return CommandResult.error("No rules to migrate after applying filters.")
-            
-        # Use PaginatedFetcher to fetch all rules from destination 
-        dest_fetcher = PaginatedFetcher(dest_client, formatter)
-        dest_rules = dest_fetcher.fetch_all(
-            "/v1/rules",
-            params=params,
-            progress_message="Fetching rules from destination..."
-        )
         
         # Compare and categorize rules
-        matching_results = match_rules_and_categorize(filtered_rules, dest_rules)
+        matching_results = match_rules_and_categorize(filtered_rules, dest_by_name)
         
         new_rules = matching_results["new_rules"]
         update_rules = matching_results["update_rules"]
@@ -91,57 +166,16 @@ def migrate_rules_between_instances(
                 {"skipped_rules": len(skipped_rules)}
             )
         
-        # Prepare response data
-        migration_data = {
-            "new_rules": [
-                {
-                    "id": rule.get("id", ""),
-                    "name": rule.get("name", ""),
-                    "type": rule.get("type", ""),
-                    "severity": rule.get("severity", ""),
-                    "status": "New"
-                }
-                for rule in new_rules
-            ],
-            "update_rules": [
-                {
-                    "id": rule.get("id", ""),
-                    "name": rule.get("name", ""),
-                    "type": rule.get("type", ""),
-                    "severity": rule.get("severity", ""),
-                    "status": "Update"
-                }
-                for rule in update_rules
-            ],
-            "skipped_rules": [
-                {
-                    "id": rule["rule"].get("id", ""),
-                    "name": rule["rule"].get("name", ""),
-                    "type": rule["rule"].get("type", ""),
-                    "severity": rule["rule"].get("severity", ""),
-                    "reason": rule["reason"]
-                }
-                for rule in skipped_rules
-            ]
-        }
-        
-        # Add summary stats
-        migration_data["summary"] = {
-            "new_count": len(new_rules),
-            "update_count": len(update_rules),
-            "skipped_count": len(skipped_rules),
-            "total_count": len(new_rules) + len(update_rules) + len(skipped_rules)
-        }
-        
         # If dry run, return preview data
         if dry_run:
             return CommandResult.success(
                 "DRY RUN: Preview of rules to migrate",
-                migration_data,
+                build_migration_data(new_rules, update_rules, skipped_rules),
                 "No changes were made to the destination instance."
             )
         
         # Show preview before confirmation in interactive mode
+        migration_data = build_migration_data(new_rules, update_rules, skipped_rules)
         formatter.output_result(CommandResult.success(
             "Rules that will be migrated:",
             migration_data,
@@ -153,7 +187,10 @@ def migrate_rules_between_instances(
             return CommandResult.success("Migration canceled by user.")
         
         # Perform the migration
-        results = perform_migration(formatter, dest_client, new_rules, update_rules, dest_rules)
+        results = perform_migration(
+            formatter, dest_client, new_rules, update_rules, dest_by_name, concurrency,
+            matching_results["payloads"]
+        )
         
         # Add results to migration data
         migration_data["results"] = results
@@ -174,54 +211,156 @@ def migrate_rules_between_instances(
             return CommandResult.error(f"Error during migration: {sublime_error.message}")
 
 
-def match_rules_and_categorize(source_rules: List[Dict], dest_rules: List[Dict]) -> Dict:
-    """Match rules between source and destination and categorize them.
+def build_migration_data(new_rules: List[RuleView], update_rules: List[RuleView],
+                         skipped_rules: List[Dict]) -> Dict:
+    """Build the migration preview shown to the user.
     
     Args:
-        source_rules: List of source rules
-        dest_rules: List of destination rules
+        new_rules: Views of the rules to create
+        update_rules: Views of the rules to update
+        skipped_rules: Skipped rule entries with "rule" view and "reason"
         
     Returns:
-        Dict: Results of matching including rules to create, update, and skip
+        Dict: Projected rules by category with summary stats
     """
-    # Create lookup dicts for destination rules
-    dest_rule_by_name = {rule.get("name"): rule for rule in dest_rules}
-    dest_rule_by_name_and_md5 = {
-        (rule.get("name"), rule.get("source_md5")): rule 
-        for rule in dest_rules
+    return {
+        "new_rules": project_rules(new_rules, status="New"),
+        "update_rules": project_rules(update_rules, status="Update"),
+        "skipped_rules": project_skipped_rules(skipped_rules),
+        "summary": {
+            "new_count": len(new_rules),
+            "update_count": len(update_rules),
+            "skipped_count": len(skipped_rules),
+            "total_count": len(new_rules) + len(update_rules) + len(skipped_rules)
+        }
     }
+
+
+def project_rules(rules: List[RuleView], status: str) -> List[Dict]:
+    """Project rules to the fields shown in migration previews.
+    
+    Args:
+        rules: Views of the rules to project
+        status: Migration status shown for every rule
+        
+    Returns:
+        List[Dict]: Projected rules
+    """
+    return [
+        {
+            "id": rule.id,
+            "name": rule.name,
+            "type": rule.type,
+            "severity": rule.severity,
+            "status": status
+        }
+        for rule in rules
+    ]
+
+
+def project_skipped_rules(skipped_rules: List[Dict]) -> List[Dict]:
+    """Project skipped rules to the fields shown in migration previews.
     
+    Args:
+        skipped_rules: Skipped rule entries with "rule" view and "reason"
+        
+    Returns:
+        List[Dict]: Projected skipped rules
+    """
+    return [
+        {
+            "id": skipped["rule"].id,
+            "name": skipped["rule"].name,
+            "type": skipped["rule"].type,
+            "severity": skipped["rule"].severity,
+            "reason": skipped["reason"]
+        }
+        for skipped in skipped_rules
+    ]
+
+
+def index_dest_rules(dest_rules: Iterable[Dict]) -> Dict[str, Dict]:
+    """Index destination rules for matching in a single pass.
+    
+    Only the rule id, source_md5 and a digest of the fields an update would
+    send are kept, so dest_rules can be a stream that is never held in memory
+    as a whole.
+    
+    Args:
+        dest_rules: Iterable of destination rules
+        
+    Returns:
+        Dict[str, Dict]: Slim destination rules by name
+    """
+    by_name = {}
+    for dest_rule in dest_rules:
+        dest_name = dest_rule.get("name")
+        by_name[dest_name] = {
+            "id": dest_rule.get("id"),
+            "name": dest_name,
+            "source_md5": dest_rule.get("source_md5"),
+            "payload_digest": content_digest(create_rule_payload(dest_rule))
+        }
+    
+    return by_name
+
+
+def match_rules_and_categorize(source_rules: List[Dict], dest_by_name: Dict[str, Dict]) -> Dict:
+    """Match rules between source and destination and categorize them.
+    
+    Args:
+        source_rules: List of source rules
+        dest_by_name: Destination rules by name from index_dest_rules
+        
+    Returns:
+        Dict: Results of matching including views of the rules to create,
+            update, and skip, and the API payloads of rules to create or update
+            by rule ID
+    """
     new_rules = []
     update_rules = []
     skipped_rules = []
+    payloads = {}
     
-    for rule in source_rules:
-        rule_name = rule.get("name")
-        rule_md5 = rule.get("source_md5")
+    for rule in map(RuleView.from_rule, source_rules):
+        existing = dest_by_name.get(rule.name)
         
         # Check if we have an exact match on name and source_md5
-        if (rule_name, rule_md5) in dest_rule_by_name_and_md5:
-            # Exact match - update the rule
-            update_rules.append(rule)
-        elif rule_name in dest_rule_by_name:
+        if existing is None:
+            # No match - new rule
+            new_rules.append(rule)
+            payloads[rule.id] = create_rule_payload(rule.rule)
+        elif existing["source_md5"] == rule.source_md5:
+            payload = create_rule_payload(rule.rule)
+            if content_digest(payload) == existing["payload_digest"]:
+                # Exact match with identical fields - nothing to update
+                skipped_rules.append({
+                    "rule": rule,
+                    "reason": "Rule is already up to date"
+                })
+            else:
+                # Exact match - update the rule
+                update_rules.append(rule)
+                payloads[rule.id] = payload
+        else:
             # Name match but different source - skip
             skipped_rules.append({
                 "rule": rule,
                 "reason": "Rule exists with same name but different content (source_md5 mismatch)"
             })
-        else:
-            # No match - new rule
-            new_rules.append(rule)
     
     return {
         "new_rules": new_rules,
         "update_rules": update_rules,
-        "skipped_rules": skipped_rules
+        "skipped_rules": skipped_rules,
+        "payloads": payloads
     }
 
 
-def perform_migration(formatter, dest_client, new_rules: List[Dict], 
-                     update_rules: List[Dict], existing_rules: List[Dict]) -> Dict:
+def perform_migration(formatter, dest_client, new_rules: List[RuleView], 
+                     update_rules: List[RuleView], existing_map: Dict[str, Dict],
+                     concurrency: int = DEFAULT_CONCURRENCY,
+                     payloads: Optional[Dict[str, Dict]] = None) -> Dict:
     """Perform the actual migration of rules to the destination.
     
     Args:
@@ -229,11 +368,19 @@ def perform_migration(formatter, dest_client, new_rules: List[Dict],
         dest_client: API client for destination
         new_rules: List of new rules to create
         update_rules: List of rules to update
-        existing_rules: List of existing rules
+        existing_map: Existing destination rules by name
+        concurrency: Maximum number of rules sent to the destination at once
+        payloads: API payloads by rule ID, built from the rules if not provided
         
     Returns:
         Dict: Results of the migration
     """
+    if payloads is None:
+        payloads = {
+            rule.id: create_rule_payload(rule.rule)
+            for rule in chain(new_rules, update_rules)
+        }
+    
     results = {
         "created": 0,
         "updated": 0,
@@ -241,107 +388,386 @@ def perform_migration(formatter, dest_client, new_rules: List[Dict],
         "failed": 0,
         "details": []
     }
+    results_lock = threading.Lock()
     
-    # Create a map of existing rules by name for quick lookup
-    existing_map = {rule.get("name"): rule for rule in existing_rules}
-    
-    # Process new rules
+    # Process new rules in batches, creating any the bulk endpoint didn't take one by one
     if new_rules:
         with formatter.create_progress("Creating new rules...", total=len(new_rules)) as (progress, task):
-            for i, rule in enumerate(new_rules):
-                process_new_rule(rule, dest_client, results)
-                progress.update(task, completed=i+1)
+            remaining_rules = create_rules_in_batches(
+                new_rules, payloads, dest_client, results, results_lock, progress, task
+            )
+            process_rules_concurrently(
+                remaining_rules,
+                lambda rule: process_new_rule(
+                    rule, payloads[rule.id], dest_client, results, results_lock
+                ),
+                concurrency, progress, task
+            )
     
     # Process updates
     if update_rules:
         with formatter.create_progress("Updating existing rules...", total=len(update_rules)) as (progress, task):
-            for i, rule in enumerate(update_rules):
-                process_update_rule(rule, dest_client, existing_map, results)
-                progress.update(task, completed=i+1)
+            process_rules_concurrently(
+                update_rules,
+                lambda rule: process_update_rule(
+                    rule, payloads[rule.id], dest_client, existing_map, results, results_lock
+                ),
+                concurrency, progress, task
+            )
     
     return results
 
 
-def process_new_rule(rule: Dict, dest_client, results: Dict):
-    """Process a new rule for migration."""
-    rule_name = rule.get("name", "")
+def create_rules_in_batches(rules: List[RuleView], payloads: Dict[str, Dict], dest_client,
+                            results: Dict, results_lock: threading.Lock, progress,
+                            task) -> List[RuleView]:
+    """Create new rules through the bulk endpoint, BULK_BATCH_SIZE rules per request.
+    
+    Rules the bulk endpoint reports as created are recorded. Rules it reports as
+    failed, and rules from batches it rejected outright, are returned so they
+    can be retried individually. When the outcome of a batch is unknown (a
+    timeout, a 5xx, or a response without per-item results) the batch may have
+    been partly written, so the destination is checked by name before any of
+    its rules is retried, to avoid creating duplicates.
+    
+    Args:
+        rules: New rules to create
+        payloads: API payloads by rule ID
+        dest_client: API client for destination
+        results: Results dictionary to update
+        results_lock: Lock guarding updates to results
+        progress: Progress indicator to update
+        task: Progress task ID
+        
+    Returns:
+        List[RuleView]: Rules that still need to be created individually, either
+            because the destination has no bulk endpoint or because the bulk
+            endpoint did not create them
+    """
+    remaining_rules = []
+    unverified_rules = []
+    
+    for start in range(0, len(rules), BULK_BATCH_SIZE):
+        batch = rules[start:start + BULK_BATCH_SIZE]
+        try:
+            response = dest_client.post_bulk(
+                BULK_CREATE_ENDPOINT, [payloads[rule.id] for rule in batch]
+            )
+        except Exception as e:
+            if isinstance(e, ApiError) and e.status_code in BULK_UNSUPPORTED_STATUS_CODES:
+                # No bulk support, so create this and all later rules individually
+                remaining_rules.extend(rules[start:])
+                break
+            if is_ambiguous_bulk_error(e):
+                # Some rules may have been written before the error
+                unverified_rules.extend(batch)
+            else:
+                # The batch was rejected as a whole, so nothing was written;
+                # retry it rule by rule so failures are reported per rule
+                remaining_rules.extend(batch)
+            continue
+        
+        failure_reasons = parse_bulk_create_response(response, len(batch))
+        if failure_reasons is None:
+            unverified_rules.extend(batch)
+            continue
+        
+        created_rules = []
+        for rule, reason in zip(batch, failure_reasons):
+            if reason is None:
+                created_rules.append(rule)
+            else:
+                remaining_rules.append(rule)
+        record_created_rules(created_rules, results, results_lock, progress, task)
+    
+    if unverified_rules:
+        remaining_rules.extend(reconcile_unverified_rules(
+            unverified_rules, dest_client, results, results_lock, progress, task
+        ))
+    
+    return remaining_rules
+
+
+def is_ambiguous_bulk_error(error: Exception) -> bool:
+    """Check whether a failed bulk request may still have created some rules.
+    
+    Client errors (4xx) mean the request was rejected before anything was
+    written, except for a conflict, which means some of the rules already
+    exist in the destination. Timeouts, connection errors and server errors
+    give no guarantee either way.
+    
+    Args:
+        error: Error raised by the bulk request
+        
+    Returns:
+        bool: True if the outcome of the request is unknown
+    """
+    if not isinstance(error, ApiError):
+        return True
+    return (
+        error.status_code is None
+        or error.status_code >= 500
+        or error.status_code in BULK_CONFLICT_STATUS_CODES
+    )
+
+
+def parse_bulk_create_response(response: Any, batch_size: int) -> Optional[List[Optional[str]]]:
+    """Read the per-item results of a bulk create response.
+    
+    The response is either a list with one result per submitted rule, in
+    request order, or an object holding that list under one of
+    BULK_RESULT_KEYS. An item failed if it carries an error, a failure status
+    or an HTTP status of 400 or above.
+    
+    Args:
+        response: Response of the bulk create request
+        batch_size: Number of rules submitted
+        
+    Returns:
+        Optional[List[Optional[str]]]: Failure reason for each submitted rule,
+            None for rules that were created; None if the response does not
+            report a result for every rule
+    """
+    items = response
+    if isinstance(response, dict):
+        items = next(
+            (response[key] for key in BULK_RESULT_KEYS if isinstance(response.get(key), list)),
+            None
+        )
+    
+    if not isinstance(items, list) or len(items) != batch_size:
+        return None
+    if not all(isinstance(item, dict) for item in items):
+        return None
+    
+    return [bulk_item_failure_reason(item) for item in items]
+
+
+def bulk_item_failure_reason(item: Dict) -> Optional[str]:
+    """Get the failure reason of a single bulk create result.
+    
+    Args:
+        item: Result for one submitted rule
+        
+    Returns:
+        Optional[str]: Failure reason, or None if the rule was created
+    """
+    error = item.get("error")
+    if error:
+        if isinstance(error, dict):
+            return str(error.get("message", error))
+        return str(error)
+    
+    status = item.get("status")
+    if isinstance(status, int) and not isinstance(status, bool) and status >= 400:
+        return f"Bulk create returned status {status}"
+    if isinstance(status, str) and status.lower() in BULK_FAILED_STATUSES:
+        return str(item.get("message") or f"Bulk create returned status '{status}'")
+    
+    return None
+
+
+def reconcile_unverified_rules(rules: List[RuleView], dest_client, results: Dict,
+                               results_lock: threading.Lock, progress,
+                               task) -> List[RuleView]:
+    """Check the destination for rules whose bulk create outcome is unknown.
+    
+    New rules had no name match in the destination when the migration
+    started, so any of them now found by name was created by the bulk
+    request. If the destination can't be read, the rules are reported as
+    failed rather than retried, since a retry could create duplicates.
+    
+    Args:
+        rules: Rules from bulk requests with an unknown outcome
+        dest_client: API client for destination
+        results: Results dictionary to update
+        results_lock: Lock guarding updates to results
+        progress: Progress indicator to update
+        task: Progress task ID
+        
+    Returns:
+        List[RuleView]: Rules not found in the destination, to be created individually
+    """
     try:
-        # Create rule payload for API request
-        payload = create_rule_payload(rule)
+        dest_names = fetch_dest_rule_names(dest_client)
+    except Exception as e:
+        sublime_error = handle_api_error(e)
+        reason = (
+            "Bulk create outcome unknown and destination rules could not be "
+            f"checked: {sublime_error.message}"
+        )
+        with results_lock:
+            results["failed"] += len(rules)
+            results["details"].extend(
+                {
+                    "name": rule.name,
+                    "type": rule.type,
+                    "status": "failed",
+                    "reason": reason
+                }
+                for rule in rules
+            )
+        progress.update(task, advance=len(rules))
+        return []
+    
+    created_rules = []
+    missing_rules = []
+    for rule in rules:
+        if rule.name in dest_names:
+            created_rules.append(rule)
+        else:
+            missing_rules.append(rule)
+    record_created_rules(created_rules, results, results_lock, progress, task)
+    
+    return missing_rules
+
+
+def fetch_dest_rule_names(dest_client) -> Set[str]:
+    """Fetch the names of all rules in the destination.
+    
+    Args:
+        dest_client: API client for destination
         
+    Returns:
+        Set[str]: Destination rule names
+    """
+    fetcher = PaginatedFetcher(dest_client)
+    return {
+        dest_rule.get("name")
+        for dest_rule in fetcher.fetch_iter("/v1/rules", params=DEST_RULE_LOOKUP_PARAMS)
+    }
+
+
+def record_created_rules(rules: List[RuleView], results: Dict, results_lock: threading.Lock,
+                         progress, task):
+    """Record rules created through the bulk endpoint.
+    
+    Args:
+        rules: Created rules
+        results: Results dictionary to update
+        results_lock: Lock guarding updates to results
+        progress: Progress indicator to update
+        task: Progress task ID
+    """
+    if not rules:
+        return
+    
+    with results_lock:
+        results["created"] += len(rules)
+        results["details"].extend(
+            {
+                "name": rule.name,
+                "type": rule.type,
+                "status": "created"
+            }
+            for rule in rules
+        )
+    progress.update(task, advance=len(rules))
+
+
+def process_rules_concurrently(rules: List[RuleView], process: Callable[[RuleView], None],
+                               concurrency: int, progress, task):
+    """Run a processing function over rules using a bounded thread pool.
+    
+    Progress is updated from the calling thread as rules complete.
+    
+    Args:
+        rules: Rules to process
+        process: Function that processes a single rule
+        concurrency: Maximum number of rules processed at once
+        progress: Progress indicator to update
+        task: Progress task ID
+    """
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [executor.submit(process, rule) for rule in rules]
+        for future in as_completed(futures):
+            future.result()
+            progress.update(task, advance=1)
+
+
+def process_new_rule(rule: RuleView, payload: Dict, dest_client, results: Dict,
+                     results_lock: threading.Lock):
+    """Process a new rule for migration."""
+    rule_name = rule.name
+    try:
         # Post to destination
         dest_client.post("/v1/rules", payload)
-        results["created"] += 1
-        results["details"].append({
-            "name": rule_name,
-            "type": rule.get("type", ""),
-            "status": "created"
-        })
+        with results_lock:
+            results["created"] += 1
+            results["details"].append({
+                "name": rule_name,
+                "type": rule.type,
+                "status": "created"
+            })
         
     except ApiError as e:
-        results["failed"] += 1
-        results["details"].append({
-            "name": rule_name,
-            "type": rule.get("type", ""),
-            "status": "failed",
-            "reason": e.message
-        })
+        with results_lock:
+            results["failed"] += 1
+            results["details"].append({
+                "name": rule_name,
+                "type": rule.type,
+                "status": "failed",
+                "reason": e.message
+            })
     except Exception as e:
         sublime_error = handle_api_error(e)
-        results["failed"] += 1
-        results["details"].append({
-            "name": rule_name,
-            "type": rule.get("type", ""),
-            "status": "failed",
-            "reason": str(sublime_error.message)
-        })
+        with results_lock:
+            results["failed"] += 1
+            results["details"].append({
+                "name": rule_name,
+                "type": rule.type,
+                "status": "failed",
+                "reason": str(sublime_error.message)
+            })
 
 
-def process_update_rule(rule: Dict, dest_client, existing_map: Dict[str, Dict], results: Dict):
+def process_update_rule(rule: RuleView, payload: Dict, dest_client, existing_map: Dict[str, Dict],
+                        results: Dict, results_lock: threading.Lock):
     """Process a rule update for migration."""
-    rule_name = rule.get("name", "")
+    rule_name = rule.name
     existing = existing_map.get(rule_name)
     
     if not existing:
-        results["skipped"] += 1
-        results["details"].append({
-            "name": rule_name,
-            "type": rule.get("type", ""),
-            "status": "skipped",
-            "reason": "Rule not found in destination"
-        })
+        with results_lock:
+            results["skipped"] += 1
+            results["details"].append({
+                "name": rule_name,
+                "type": rule.type,
+                "status": "skipped",
+                "reason": "Rule not found in destination"
+            })
         return
     
     try:
-        # Create update payload
-        payload = create_rule_payload(rule)
-        
         # Update the rule
         dest_client.patch(f"/v1/rules/{existing.get('id')}", payload)
-        results["updated"] += 1
-        results["details"].append({
-            "name": rule_name,
-            "type": rule.get("type", ""),
-            "status": "updated"
-        })
+        with results_lock:
+            results["updated"] += 1
+            results["details"].append({
+                "name": rule_name,
+                "type": rule.type,
+                "status": "updated"
+            })
             
     except ApiError as e:
-        results["failed"] += 1
-        results["details"].append({
-            "name": rule_name,
-            "type": rule.get("type", ""),
-            "status": "failed",
-            "reason": e.message
-        })
+        with results_lock:
+            results["failed"] += 1
+            results["details"].append({
+                "name": rule_name,
+                "type": rule.type,
+                "status": "failed",
+                "reason": e.message
+            })
     except Exception as e:
         sublime_error = handle_api_error(e)
-        results["failed"] += 1
-        results["details"].append({
-            "name": rule_name,
-            "type": rule.get("type", ""),
-            "status": "failed",
-            "reason": str(sublime_error.message)
-        })
+        with results_lock:
+            results["failed"] += 1
+            results["details"].append({
+                "name": rule_name,
+                "type": rule.type,
+                "status": "failed",
+                "reason": str(sublime_error.message)
+            })
 
 
 def create_rule_payload(rule: Dict) -> Dict:
@@ -363,16 +789,10 @@ def create_rule_payload(rule: Dict) -> Dict:
     }
     
     # Include optional fields if present
-    optional_fields = [
-        "attack_types", "auto_review_auto_share", "auto_review_classification",
-        "detection_methods", "false_positives", "maturity", "references",
-        "severity", "tactics_and_techniques", "tags", "user_provided_tags",
-        "triage_abuse_reports", "triage_flagged_messages"
-    ]
-    
-    for field in optional_fields:
-        if field in rule and rule[field] is not None:
-            payload[field] = rule[field]
+    payload.update({
+        field: rule[field] for field in OPTIONAL_RULE_FIELDS
+        if rule.get(field) is not None
+    })
     
     return payload
 
@@ -391,8 +811,13 @@ def create_rule_payload(rule: Dict) -> Dict:
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompts")
 @click.option("--format", "output_format", type=click.Choice(["table", "json"]), default="table",
               help="Output format (table or json)")
+@click.option("--concurrency", type=click.IntRange(min=1), default=DEFAULT_CONCURRENCY, show_default=True,
+              help="Maximum number of rules sent to the destination at once")
+@click.option("--rate-limit", type=click.FloatRange(min=0, min_open=True),
+              help="Maximum requests per second sent to the destination (default: unlimited)")
 def rules(source_api_key, source_region, dest_api_key, dest_region,
-          include_rule_ids, exclude_rule_ids, rule_type, dry_run, yes, output_format):
+          include_rule_ids, exclude_rule_ids, rule_type, dry_run, yes, output_format,
+          concurrency, rate_limit):
     """Migrate rules between Sublime Security instances.
     
     This command copies rules from the source instance to the destination instance.
@@ -417,23 +842,16 @@ def rules(source_api_key, source_region, dest_api_key, dest_region,
     # Create formatter based on output format
     formatter = create_formatter(output_format)
     
-    # If --yes flag is provided, modify the formatter to auto-confirm
-    if yes:
-        original_prompt = formatter.prompt_confirmation
-        formatter.prompt_confirmation = lambda _: True
-    
-    # Execute the implementation function
-    result = migrate_rules_between_instances(
-        source_api_key, source_region, 
-        dest_api_key, dest_region,
-        include_rule_ids, exclude_rule_ids, 
-        rule_type,
-        dry_run, formatter
-    )
-    
-    # Reset the formatter if it was modified
-    if yes and hasattr(formatter, 'original_prompt'):
-        formatter.prompt_confirmation = original_prompt
+    # Execute the implementation function, auto-confirming if --yes was provided
+    with auto_confirm(formatter, yes):
+        result = migrate_rules_between_instances(
+            source_api_key, source_region, 
+            dest_api_key, dest_region,
+            include_rule_ids, exclude_rule_ids, 
+            rule_type,
+            dry_run, formatter,
+            concurrency, rate_limit
+        )
     
     # Output the result
     formatter.output_result(result)
\ No newline at end of file
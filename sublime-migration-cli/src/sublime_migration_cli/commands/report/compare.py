@@ -1,8 +1,11 @@
 """Compare configuration between Sublime Security instances."""
-from typing import Dict, List, Optional, Set
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from itertools import chain
+from operator import methodcaller
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 import click
 
-from sublime_migration_cli.api.client import get_api_client_from_env_or_args
+from sublime_migration_cli.api.client import get_cached_api_client
 from sublime_migration_cli.presentation.base import CommandResult
 from sublime_migration_cli.presentation.factory import create_formatter
 
@@ -13,6 +16,35 @@ from sublime_migration_cli.utils.errors import (
 )
 
 
+# Maximum number of object types fetched from the instances at once
+FETCH_CONCURRENCY = 8
+
+# Sentinel for names missing from a lookup map
+MISSING = object()
+
+# Key function reading an object's name; objects without one get None
+# and are reported as unmatched rather than failing the whole report
+get_name = methodcaller("get", "name")
+
+# Counts in each object type's summary that are totalled across types
+SUMMARY_COUNT_FIELDS = ("source_count", "dest_count", "matching", "differences")
+
+# Fields identifying the content of each object type; objects are equivalent
+# when all of these fields are equal
+COMPARISON_FIELDS = {
+    # For actions, compare type and config
+    "actions": ("type", "config"),
+    # For lists, compare entry_type
+    "lists": ("entry_type", "name", "description"),
+    # For exclusions, compare source_md5 instead of source and scope
+    "exclusions": ("source_md5",),
+    # For feeds, compare git_url and git_branch
+    "feeds": ("git_url", "git_branch"),
+    # For rules, compare source_md5
+    "rules": ("source_md5",),
+}
+
+
 def compare_instances(
     source_api_key=None, source_region=None, 
     dest_api_key=None, dest_region=None,
@@ -41,8 +73,8 @@ def compare_instances(
     try:
         # Create API clients for source and destination
         with formatter.create_progress("Connecting to source and destination instances...") as (progress, task):
-            source_client = get_api_client_from_env_or_args(source_api_key, source_region)
-            dest_client = get_api_client_from_env_or_args(dest_api_key, dest_region, destination=True)
+            source_client = get_cached_api_client(source_api_key, source_region)
+            dest_client = get_cached_api_client(dest_api_key, dest_region, destination=True)
             progress.update(task, advance=1)
         
         # Get instance information for report headers
@@ -71,29 +103,35 @@ def compare_instances(
         summary = {}
         differences = {}
         
-        # Fetch and compare each object type
+        # Fetch and compare every object type concurrently. Only one progress
+        # display can be live at a time, so all types share a single one.
+        with formatter.create_progress("Comparing objects...", total=len(compare_types)) as (progress, task):
+            with ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY) as executor:
+                # Destination fetches are queued first, so every compare task
+                # waiting on one is guaranteed it has already started
+                dest_futures = {
+                    obj_type: executor.submit(fetch_objects_by_type, dest_fetcher, obj_type)
+                    for obj_type in compare_types
+                }
+                compare_futures = {
+                    obj_type: executor.submit(
+                        compare_object_type, source_fetcher, dest_futures[obj_type], obj_type
+                    )
+                    for obj_type in compare_types
+                }
+                for future in as_completed(compare_futures.values()):
+                    future.result()
+                    progress.update(task, advance=1)
+        
+        # Store results in the order the types were requested
         for obj_type in compare_types:
-            with formatter.create_progress(f"Comparing {obj_type}...") as (progress, task):
-                # Fetch objects from source and destination
-                source_objects = fetch_objects_by_type(source_fetcher, obj_type)
-                dest_objects = fetch_objects_by_type(dest_fetcher, obj_type)
-                
-                # Compare objects and get results
-                type_summary, type_differences = compare_objects(source_objects, dest_objects, obj_type)
-                
-                # Store results
-                summary[obj_type] = type_summary
-                differences[obj_type] = type_differences
-                
-                progress.update(task, advance=1)
+            summary[obj_type], differences[obj_type] = compare_futures[obj_type].result()
         
-        # Calculate totals for summary
-        total_summary = {
-            "source_count": sum(s.get("source_count", 0) for s in summary.values()),
-            "dest_count": sum(s.get("dest_count", 0) for s in summary.values()),
-            "matching": sum(s.get("matching", 0) for s in summary.values()),
-            "differences": sum(s.get("differences", 0) for s in summary.values())
-        }
+        # Calculate totals for summary in a single pass over the types
+        total_summary = dict.fromkeys(SUMMARY_COUNT_FIELDS, 0)
+        for type_summary in summary.values():
+            for field in SUMMARY_COUNT_FIELDS:
+                total_summary[field] += type_summary.get(field, 0)
         summary["total"] = total_summary
         
         # Prepare source and destination info for the report
@@ -145,6 +183,33 @@ def compare_instances(
             )
 
 
+def compare_object_type(source_fetcher: PaginatedFetcher, dest_future: Future,
+                        obj_type: str) -> tuple:
+    """Compare one object type, streaming source objects as they are fetched.
+    
+    The first source pages are fetched while the destination fetch is still
+    running, but only one page is held until the destination objects arrive.
+    
+    Args:
+        source_fetcher: PaginatedFetcher for the source instance
+        dest_future: Future resolving to the destination objects
+        obj_type: Type of objects to compare
+    
+    Returns:
+        tuple: (summary_dict, differences_dict)
+    """
+    source_objects = iter_objects_by_type(source_fetcher, obj_type)
+    
+    # Start fetching the source before waiting on the destination
+    first_source_object = next(source_objects, None)
+    dest_objects = dest_future.result()
+    
+    if first_source_object is not None:
+        source_objects = chain([first_source_object], source_objects)
+    
+    return compare_objects(source_objects, dest_objects, obj_type)
+
+
 def fetch_objects_by_type(fetcher: PaginatedFetcher, obj_type: str) -> List[Dict]:
     """Fetch objects from an instance based on type.
     
@@ -155,6 +220,50 @@ def fetch_objects_by_type(fetcher: PaginatedFetcher, obj_type: str) -> List[Dict
     Returns:
         List[Dict]: Fetched objects
     """
+    return list(iter_objects_by_type(fetcher, obj_type))
+
+
+def unwrapping_extractors(key: str) -> Tuple[Callable[[Any], List], Callable[[Any], int]]:
+    """Create extractors for an endpoint that wraps its items under a key.
+    
+    Such endpoints return every item at once without a total, so the total is
+    the number of items in the response.
+    
+    Args:
+        key: Key holding the items in dict responses
+    
+    Returns:
+        tuple: (result_extractor, total_extractor)
+    """
+    def result_extractor(response: Any) -> List:
+        return response.get(key, []) if isinstance(response, dict) else response
+    
+    def total_extractor(response: Any) -> int:
+        return len(result_extractor(response))
+    
+    return result_extractor, total_extractor
+
+
+# Extractors for endpoints with a different response structure, built once
+# rather than on every fetch
+RESPONSE_EXTRACTORS = {
+    "feeds": unwrapping_extractors("feeds"),
+    "exclusions": unwrapping_extractors("exclusions"),
+}
+
+
+def iter_objects_by_type(fetcher: PaginatedFetcher, obj_type: str) -> Iterator[Dict]:
+    """Iterate over objects from an instance based on type.
+    
+    Each next page is fetched while the current one is consumed.
+    
+    Args:
+        fetcher: PaginatedFetcher to use
+        obj_type: Type of objects to fetch (actions, rules, etc.)
+    
+    Yields:
+        Dict: Fetched objects
+    """
     endpoint = f"/v1/{obj_type}"
     params = {}
     
@@ -166,95 +275,77 @@ def fetch_objects_by_type(fetcher: PaginatedFetcher, obj_type: str) -> List[Dict
         # Only fetch global exclusions, not rule exclusions
         params["scope"] = "exclusion"
     
-    # Use extractor functions appropriate for this endpoint
-    if obj_type == "feeds":
-        # Feeds API has a different response structure
-        result_extractor = lambda resp: resp.get("feeds", []) if isinstance(resp, dict) else resp
-        total_extractor = lambda resp: len(resp.get("feeds", [])) if isinstance(resp, dict) else len(resp)
-    elif obj_type == "exclusions":
-        # Exclusions API has a different response structure
-        result_extractor = lambda resp: resp.get("exclusions", []) if isinstance(resp, dict) else resp
-        total_extractor = lambda resp: len(resp.get("exclusions", [])) if isinstance(resp, dict) else len(resp)
-    else:
-        # Use default extractors for other types
-        result_extractor = None
-        total_extractor = None
+    # Use extractor functions appropriate for this endpoint, falling back to
+    # the default extractors for other types
+    result_extractor, total_extractor = RESPONSE_EXTRACTORS.get(obj_type, (None, None))
     
     # Fetch objects
-    objects = fetcher.fetch_all(
+    return fetcher.fetch_iter(
         endpoint,
         params=params,
         progress_message=None,  # Don't show nested progress
         result_extractor=result_extractor,
-        total_extractor=total_extractor
+        total_extractor=total_extractor,
+        prefetch=True
     )
-    
-    return objects
 
 
-def compare_objects(source_objects: List[Dict], dest_objects: List[Dict], obj_type: str) -> tuple:
+def compare_objects(source_objects: Iterable[Dict], dest_objects: List[Dict], obj_type: str) -> tuple:
     """Compare objects between source and destination.
     
+    Source objects are consumed in a single pass, so they may be streamed.
+    
     Args:
-        source_objects: List of objects from source
+        source_objects: Objects from source
         dest_objects: List of objects from destination
         obj_type: Type of objects being compared
     
     Returns:
         tuple: (summary_dict, differences_dict)
     """
-    # Create lookup maps for destination objects
-    dest_by_name = {obj.get("name"): obj for obj in dest_objects}
-    
-    # For rules, also use source_md5 for deeper comparison
-    if obj_type == "rules":
-        dest_by_name_md5 = {
-            (obj.get("name"), obj.get("source_md5")): obj 
-            for obj in dest_objects
-        }
+    # Create lookup maps for destination objects, fingerprinting each once
+    fields = COMPARISON_FIELDS.get(obj_type)
+    dest_by_name = dict(zip(
+        map(get_name, dest_objects),
+        (object_fingerprint(obj, fields) for obj in dest_objects)
+    ))
     
     # Track different categories
     matching = []
     missing_in_dest = []
     missing_in_source = []
     content_differs = []
+    source_names = set()
+    source_count = 0
     
     # Compare each source object to destination
     for source_obj in source_objects:
-        name = source_obj.get("name")
+        name = get_name(source_obj)
+        source_names.add(name)
+        source_count += 1
         
-        if obj_type == "rules":
-            # Special handling for rules - check name and source_md5
-            md5 = source_obj.get("source_md5")
-            if (name, md5) in dest_by_name_md5:
-                # Exact match (same content)
-                matching.append(name)
-            elif name in dest_by_name:
-                # Name exists but content differs
-                content_differs.append(name)
-            else:
-                # Rule doesn't exist in destination
-                missing_in_dest.append(name)
+        # A single lookup by name covers every type; for rules the
+        # fingerprint is the source_md5
+        dest_fingerprint = dest_by_name.get(name, MISSING)
+        if dest_fingerprint is MISSING:
+            # Object doesn't exist in destination
+            missing_in_dest.append(name)
+        elif object_fingerprint(source_obj, fields) == dest_fingerprint:
+            # Exact match (same content)
+            matching.append(name)
         else:
-            # Standard handling for other object types
-            if name in dest_by_name:
-                if are_objects_equivalent(source_obj, dest_by_name[name], obj_type):
-                    matching.append(name)
-                else:
-                    content_differs.append(name)
-            else:
-                missing_in_dest.append(name)
-    
-    # Find objects in destination but not in source
-    source_names = {obj.get("name") for obj in source_objects}
-    for dest_obj in dest_objects:
-        name = dest_obj.get("name")
-        if name not in source_names:
-            missing_in_source.append(name)
+            # Name exists but content differs
+            content_differs.append(name)
+    
+    # Find objects in destination but not in source with a set difference,
+    # only walking the destination (for its ordering) when there are any
+    missing_names = dest_by_name.keys() - source_names
+    if missing_names:
+        missing_in_source = [name for name in dest_by_name if name in missing_names]
     
     # Prepare summary
     summary = {
-        "source_count": len(source_objects),
+        "source_count": source_count,
         "dest_count": len(dest_objects),
         "matching": len(matching),
         "differences": len(missing_in_dest) + len(missing_in_source) + len(content_differs)
@@ -281,40 +372,25 @@ def are_objects_equivalent(obj1: Dict, obj2: Dict, obj_type: str) -> bool:
     Returns:
         bool: True if objects are equivalent
     """
-    # Different comparison logic based on object type
+    fields = COMPARISON_FIELDS.get(obj_type)
+    return object_fingerprint(obj1, fields) == object_fingerprint(obj2, fields)
 
-    if obj_type == "actions":
-        # For actions, compare type and config
-        return (
-            obj1.get("type") == obj2.get("type") and
-            obj1.get("config") == obj2.get("config")
-        )
-    
-    elif obj_type == "lists":
-        # For lists, compare entry_type
-        return (
-            obj1.get("entry_type") == obj2.get("entry_type") and
-            obj1.get("name") == obj2.get("name") and
-            obj1.get("description") == obj2.get("description")
-        )
-    
-    elif obj_type == "exclusions":
-        # For exclusions, compare source_md5 instead of source and scope
-        return obj1.get("source_md5") == obj2.get("source_md5")
-    
-    elif obj_type == "feeds":
-        # For feeds, compare git_url and git_branch
-        return (
-            obj1.get("git_url") == obj2.get("git_url") and
-            obj1.get("git_branch") == obj2.get("git_branch")
-        )
+
+def object_fingerprint(obj: Dict, fields: Optional[tuple]) -> Any:
+    """Extract the values that identify an object's content.
     
-    elif obj_type == "rules":
-        # For rules, compare source_md5 (should never happen as this is handled separately)
-        return obj1.get("source_md5") == obj2.get("source_md5")
+    Args:
+        obj: Object to fingerprint
+        fields: Fields identifying the object's content from COMPARISON_FIELDS,
+            or None to compare whole objects
     
+    Returns:
+        Any: Values of the fields, or the object itself if fields is None
+    """
     # Default comparison
-    return obj1 == obj2
+    if fields is None:
+        return obj
+    return tuple(map(obj.get, fields))
 
 
 @click.command()
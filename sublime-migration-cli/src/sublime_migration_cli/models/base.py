@@ -0,0 +1,41 @@
+"""Shared helpers for Sublime Security models."""
+import sys
+from dataclasses import dataclass
+
+# Models are created in bulk from API responses, so use slotted instances
+# without a per-instance __dict__ where dataclasses support them (3.10+)
+MODEL_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def model_dataclass(cls=None, **options):
+    """Declare a model dataclass, slotted where supported.
+    
+    Can be applied bare (@model_dataclass) or with further dataclass options
+    (@model_dataclass(frozen=True)).
+    
+    Args:
+        cls: Class to declare, when applied bare
+        **options: Additional dataclass options
+        
+    Returns:
+        The dataclass, or a decorator creating it when called with options
+    """
+    options = {**MODEL_DATACLASS_OPTIONS, **options}
+    if cls is None:
+        return dataclass(**options)
+    return dataclass(cls, **options)
+
+
+def intern_value(value):
+    """Intern a string drawn from a small vocabulary, such as a severity.
+    
+    Instances built from the same response then share one string object per
+    distinct value. Values that aren't strings are returned unchanged.
+    
+    Args:
+        value: Value to intern
+        
+    Returns:
+        The interned string, or the value itself
+    """
+    return sys.intern(value) if type(value) is str else value
@@ -1,9 +1,10 @@
 """Model for Sublime Security Exclusion."""
-from dataclasses import dataclass
 from typing import Dict, List, Optional
 
+from sublime_migration_cli.models.base import model_dataclass
 
-@dataclass
+
+@model_dataclass
 class OriginatingRule:
     """Represents a rule associated with a rule exclusion."""
 
@@ -16,16 +17,17 @@ class OriginatingRule:
     @classmethod
     def from_dict(cls, data: Dict) -> "OriginatingRule":
         """Create an OriginatingRule instance from a dictionary."""
-        return cls(
-            id=data.get("id", ""),
-            name=data.get("name", ""),
-            type=data.get("type", ""),
-            active=data.get("active", False),
-            org_id=data.get("org_id", "")
-        )
+        # Assign fields directly, skipping keyword argument binding
+        rule = cls.__new__(cls)
+        rule.id = data.get("id", "")
+        rule.name = data.get("name", "")
+        rule.type = data.get("type", "")
+        rule.active = data.get("active", False)
+        rule.org_id = data.get("org_id", "")
+        return rule
 
 
-@dataclass
+@model_dataclass
 class Exclusion:
     """Represents an exclusion in the Sublime Security Platform."""
 
@@ -62,25 +64,26 @@ class Exclusion:
         if data.get("originating_rule"):
             originating_rule = OriginatingRule.from_dict(data["originating_rule"])
             
-        return cls(
-            id=data.get("id", ""),
-            org_id=data.get("org_id", ""),
-            active=data.get("active", False),
-            source=data.get("source", ""),
-            source_md5=data.get("source_md5", ""),
-            name=data.get("name", ""),
-            description=data.get("description", ""),
-            scope=data.get("scope", ""),
-            created_at=data.get("created_at", ""),
-            updated_at=data.get("updated_at", ""),
-            active_updated_at=data.get("active_updated_at", ""),
-            tags=data.get("tags"),
-            created_by_org_id=data.get("created_by_org_id"),
-            created_by_org_name=data.get("created_by_org_name"),
-            created_by_user_id=data.get("created_by_user_id"),
-            created_by_user_name=data.get("created_by_user_name"),
-            originating_rule=originating_rule
-        )
+        # Assign fields directly, skipping keyword argument binding
+        exclusion = cls.__new__(cls)
+        exclusion.id = data.get("id", "")
+        exclusion.org_id = data.get("org_id", "")
+        exclusion.active = data.get("active", False)
+        exclusion.source = data.get("source", "")
+        exclusion.source_md5 = data.get("source_md5", "")
+        exclusion.name = data.get("name", "")
+        exclusion.description = data.get("description", "")
+        exclusion.scope = data.get("scope", "")
+        exclusion.created_at = data.get("created_at", "")
+        exclusion.updated_at = data.get("updated_at", "")
+        exclusion.active_updated_at = data.get("active_updated_at", "")
+        exclusion.tags = data.get("tags")
+        exclusion.created_by_org_id = data.get("created_by_org_id")
+        exclusion.created_by_org_name = data.get("created_by_org_name")
+        exclusion.created_by_user_id = data.get("created_by_user_id")
+        exclusion.created_by_user_name = data.get("created_by_user_name")
+        exclusion.originating_rule = originating_rule
+        return exclusion
     
     def to_dict(self) -> Dict:
         """Convert the exclusion to a dictionary.
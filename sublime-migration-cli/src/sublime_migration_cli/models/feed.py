@@ -1,9 +1,10 @@
 """Model for Sublime Security Feed."""
-from dataclasses import dataclass
 from typing import Dict, Optional
 
+from sublime_migration_cli.models.base import model_dataclass
 
-@dataclass
+
+@model_dataclass
 class FeedSummary:
     """Summary information for a feed."""
 
@@ -18,6 +19,32 @@ class FeedSummary:
     up_to_date: int
     yara_sigs: int
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "FeedSummary":
+        """Create a FeedSummary instance from a dictionary.
+        
+        Unknown keys are ignored and missing counts default to zero.
+        
+        Args:
+            data: Dictionary containing feed summary data
+            
+        Returns:
+            FeedSummary: New FeedSummary instance
+        """
+        # Assign fields directly, skipping keyword argument binding
+        summary = cls.__new__(cls)
+        summary.active = data.get("active", 0)
+        summary.available_changes = data.get("available_changes", False)
+        summary.deletions = data.get("deletions", 0)
+        summary.invalid = data.get("invalid", 0)
+        summary.installed = data.get("installed", 0)
+        summary.new = data.get("new", 0)
+        summary.out_of_date = data.get("out_of_date", 0)
+        summary.total = data.get("total", 0)
+        summary.up_to_date = data.get("up_to_date", 0)
+        summary.yara_sigs = data.get("yara_sigs", 0)
+        return summary
+
     def to_dict(self) -> Dict:
         """Convert the feed summary to a dictionary.
         
@@ -38,7 +65,7 @@ class FeedSummary:
         }
 
 
-@dataclass
+@model_dataclass
 class Feed:
     """Represents a feed in the Sublime Security Platform."""
 
@@ -69,23 +96,24 @@ class Feed:
         # Process summary if it exists
         summary = None
         if data.get("summary"):
-            summary = FeedSummary(**data["summary"])
-            
-        return cls(
-            id=data.get("id", ""),
-            name=data.get("name", ""),
-            git_url=data.get("git_url", ""),
-            git_branch=data.get("git_branch", ""),
-            is_system=data.get("is_system", False),
-            checked_at=data.get("checked_at", ""),
-            retrieved_at=data.get("retrieved_at", ""),
-            auto_update_rules=data.get("auto_update_rules", False),
-            auto_activate_new_rules=data.get("auto_activate_new_rules", False),
-            detection_rule_file_filter=data.get("detection_rule_file_filter", ""),
-            triage_rule_file_filter=data.get("triage_rule_file_filter", ""),
-            yara_file_filter=data.get("yara_file_filter", ""),
-            summary=summary
-        )
+            summary = FeedSummary.from_dict(data["summary"])
+        
+        # Assign fields directly, skipping keyword argument binding
+        feed = cls.__new__(cls)
+        feed.id = data.get("id", "")
+        feed.name = data.get("name", "")
+        feed.git_url = data.get("git_url", "")
+        feed.git_branch = data.get("git_branch", "")
+        feed.is_system = data.get("is_system", False)
+        feed.checked_at = data.get("checked_at", "")
+        feed.retrieved_at = data.get("retrieved_at", "")
+        feed.auto_update_rules = data.get("auto_update_rules", False)
+        feed.auto_activate_new_rules = data.get("auto_activate_new_rules", False)
+        feed.detection_rule_file_filter = data.get("detection_rule_file_filter", "")
+        feed.triage_rule_file_filter = data.get("triage_rule_file_filter", "")
+        feed.yara_file_filter = data.get("yara_file_filter", "")
+        feed.summary = summary
+        return feed
     
     def to_dict(self) -> Dict:
         """Convert the feed to a dictionary.
@@ -110,17 +138,6 @@ class Feed:
         
         # Include summary if present
         if self.summary:
-            result["summary"] = {
-                "active": self.summary.active,
-                "available_changes": self.summary.available_changes,
-                "deletions": self.summary.deletions,
-                "invalid": self.summary.invalid,
-                "installed": self.summary.installed,
-                "new": self.summary.new,
-                "out_of_date": self.summary.out_of_date,
-                "total": self.summary.total,
-                "up_to_date": self.summary.up_to_date,
-                "yara_sigs": self.summary.yara_sigs,
-            }
+            result["summary"] = self.summary.to_dict()
         
         return result
\ No newline at end of file
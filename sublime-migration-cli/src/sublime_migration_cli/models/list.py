@@ -1,9 +1,10 @@
 """Model for Sublime Security List."""
-from dataclasses import dataclass
 from typing import Dict, List as PyList, Optional
 
+from sublime_migration_cli.models.base import intern_value, model_dataclass
 
-@dataclass
+
+@model_dataclass
 class List:
     """Represents a list in the Sublime Security Platform."""
 
@@ -35,25 +36,26 @@ class List:
         Returns:
             List: New List instance
         """
-        return cls(
-            id=data.get("id", ""),
-            name=data.get("name", ""),
-            description=data.get("description", ""),
-            download_url=data.get("download_url", ""),
-            org_id=data.get("org_id", ""),
-            org_name=data.get("org_name", ""),
-            created_by_user_id=data.get("created_by_user_id", ""),
-            created_by_user_name=data.get("created_by_user_name", ""),
-            viewable=data.get("viewable", False),
-            editable=data.get("editable", False),
-            entry_type=data.get("entry_type", ""),
-            created_at=data.get("created_at", ""),
-            updated_at=data.get("updated_at", ""),
-            entries=data.get("entries"),
-            entry_count=data.get("entry_count", 0),
-            provider_group_id=data.get("provider_group_id"),
-            provider_group_name=data.get("provider_group_name"),
-        )
+        # Assign fields directly, skipping keyword argument binding
+        lst = cls.__new__(cls)
+        lst.id = data.get("id", "")
+        lst.name = data.get("name", "")
+        lst.description = data.get("description", "")
+        lst.download_url = data.get("download_url", "")
+        lst.org_id = data.get("org_id", "")
+        lst.org_name = data.get("org_name", "")
+        lst.created_by_user_id = data.get("created_by_user_id", "")
+        lst.created_by_user_name = data.get("created_by_user_name", "")
+        lst.viewable = data.get("viewable", False)
+        lst.editable = data.get("editable", False)
+        lst.entry_type = intern_value(data.get("entry_type", ""))
+        lst.created_at = data.get("created_at", "")
+        lst.updated_at = data.get("updated_at", "")
+        lst.entries = data.get("entries")
+        lst.entry_count = data.get("entry_count", 0)
+        lst.provider_group_id = data.get("provider_group_id")
+        lst.provider_group_name = data.get("provider_group_name")
+        return lst
     
     def to_dict(self) -> Dict:
         """Convert the list to a dictionary.
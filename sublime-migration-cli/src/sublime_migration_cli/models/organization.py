@@ -1,9 +1,10 @@
 """Model for Sublime Security Organization Settings."""
-from dataclasses import dataclass
 from typing import Dict, List, Optional
 
+from sublime_migration_cli.models.base import model_dataclass
 
-@dataclass
+
+@model_dataclass
 class AuditEventsExport:
     """Audit events export configuration."""
     
@@ -13,7 +14,7 @@ class AuditEventsExport:
     export_format: Optional[str] = None
     
     @classmethod
-    def from_dict(cls, data: Dict) -> "AuditEventsExport":
+    def from_dict(cls, data: Optional[Dict]) -> "AuditEventsExport":
         """Create AuditEventsExport from dictionary."""
         if not data:
             return cls()
@@ -39,7 +40,7 @@ class AuditEventsExport:
         return result
 
 
-@dataclass
+@model_dataclass
 class MessageExport:
     """Message export configuration."""
     
@@ -48,7 +49,7 @@ class MessageExport:
     message_export_s3_region: Optional[str] = None
     
     @classmethod
-    def from_dict(cls, data: Dict) -> "MessageExport":
+    def from_dict(cls, data: Optional[Dict]) -> "MessageExport":
         """Create MessageExport from dictionary."""
         if not data:
             return cls()
@@ -71,7 +72,7 @@ class MessageExport:
         return result
 
 
-@dataclass
+@model_dataclass
 class OIDCConfig:
     """OIDC configuration."""
     
@@ -82,7 +83,7 @@ class OIDCConfig:
     initiate_login_url: Optional[str] = None
     
     @classmethod
-    def from_dict(cls, data: Dict) -> "OIDCConfig":
+    def from_dict(cls, data: Optional[Dict]) -> "OIDCConfig":
         """Create OIDCConfig from dictionary."""
         if not data:
             return cls()
@@ -111,7 +112,7 @@ class OIDCConfig:
         return result
 
 
-@dataclass
+@model_dataclass
 class SAMLConfig:
     """SAML configuration."""
     
@@ -119,7 +120,7 @@ class SAMLConfig:
     sso_url: Optional[str] = None
     
     @classmethod
-    def from_dict(cls, data: Dict) -> "SAMLConfig":
+    def from_dict(cls, data: Optional[Dict]) -> "SAMLConfig":
         """Create SAMLConfig from dictionary."""
         if not data:
             return cls()
@@ -139,7 +140,7 @@ class SAMLConfig:
         return result
 
 
-@dataclass
+@model_dataclass
 class TelemetryConfig:
     """Telemetry configuration."""
     
@@ -148,7 +149,7 @@ class TelemetryConfig:
     telemetry_errors_usage: bool = True
     
     @classmethod
-    def from_dict(cls, data: Dict) -> "TelemetryConfig":
+    def from_dict(cls, data: Optional[Dict]) -> "TelemetryConfig":
         """Create TelemetryConfig from dictionary."""
         if not data:
             return cls()
@@ -168,7 +169,7 @@ class TelemetryConfig:
         }
 
 
-@dataclass
+@model_dataclass
 class IPAllowlistEntry:
     """IP allowlist entry."""
     
@@ -178,10 +179,11 @@ class IPAllowlistEntry:
     @classmethod
     def from_dict(cls, data: Dict) -> "IPAllowlistEntry":
         """Create IPAllowlistEntry from dictionary."""
-        return cls(
-            ip=data.get("ip", ""),
-            notes=data.get("notes")
-        )
+        # Assign fields directly, skipping keyword argument binding
+        entry = cls.__new__(cls)
+        entry.ip = data.get("ip", "")
+        entry.notes = data.get("notes")
+        return entry
     
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
@@ -191,7 +193,7 @@ class IPAllowlistEntry:
         return result
 
 
-@dataclass
+@model_dataclass
 class OrganizationSettings:
     """Organization settings for Sublime Security."""
     
@@ -235,23 +237,24 @@ class OrganizationSettings:
                 for entry in data["ip_allowlist_json"]
             ]
         
-        return cls(
-            allowed_identity_providers=data.get("allowed_identity_providers"),
-            oidc_config=OIDCConfig.from_dict(data.get("oidc_config", {})),
-            saml_config=SAMLConfig.from_dict(data.get("saml_config", {})),
-            auto_activate_synced_mailboxes=data.get("auto_activate_synced_mailboxes", True),
-            enable_inline_processing=data.get("enable_inline_processing", False),
-            mdm_retention_days=data.get("mdm_retention_days", 30),
-            full_message_retention_days=data.get("full_message_retention_days", 30),
-            flagged_or_reported_message_retention_days=data.get("flagged_or_reported_message_retention_days", 1825),
-            abuse_mailboxes=data.get("abuse_mailboxes"),
-            allow_unauthenticated_user_reports=data.get("allow_unauthenticated_user_reports", False),
-            require_message_access_justification=data.get("require_message_access_justification", True),
-            ip_allowlist_json=ip_allowlist,
-            audit_events_export=AuditEventsExport.from_dict(data.get("audit_events_export", {})),
-            message_export=MessageExport.from_dict(data.get("message_export", {})),
-            telemetry=TelemetryConfig.from_dict(data.get("telemetry", {}))
-        )
+        # Assign fields directly, skipping keyword argument binding
+        settings = cls.__new__(cls)
+        settings.allowed_identity_providers = data.get("allowed_identity_providers")
+        settings.oidc_config = OIDCConfig.from_dict(data.get("oidc_config"))
+        settings.saml_config = SAMLConfig.from_dict(data.get("saml_config"))
+        settings.auto_activate_synced_mailboxes = data.get("auto_activate_synced_mailboxes", True)
+        settings.enable_inline_processing = data.get("enable_inline_processing", False)
+        settings.mdm_retention_days = data.get("mdm_retention_days", 30)
+        settings.full_message_retention_days = data.get("full_message_retention_days", 30)
+        settings.flagged_or_reported_message_retention_days = data.get("flagged_or_reported_message_retention_days", 1825)
+        settings.abuse_mailboxes = data.get("abuse_mailboxes")
+        settings.allow_unauthenticated_user_reports = data.get("allow_unauthenticated_user_reports", False)
+        settings.require_message_access_justification = data.get("require_message_access_justification", True)
+        settings.ip_allowlist_json = ip_allowlist
+        settings.audit_events_export = AuditEventsExport.from_dict(data.get("audit_events_export"))
+        settings.message_export = MessageExport.from_dict(data.get("message_export"))
+        settings.telemetry = TelemetryConfig.from_dict(data.get("telemetry"))
+        return settings
     
     def to_dict(self, include_sensitive: bool = False) -> Dict:
         """Convert to dictionary."""
@@ -1,16 +1,40 @@
 """Models for Sublime Security Rules."""
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
 
+from sublime_migration_cli.models.base import intern_value, model_dataclass
 
-@dataclass
+
+# Maximum number of distinct rule actions kept for sharing between rules
+RULE_ACTION_CACHE_SIZE = 1024
+
+
+@model_dataclass(frozen=True)
 class RuleAction:
-    """Represents an action associated with a rule."""
+    """Represents an action associated with a rule.
+    
+    Rule actions are immutable, so identical ones referenced by many rules
+    share a single instance.
+    """
     
     id: str
     name: str
     active: bool
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "RuleAction":
+        """Create a RuleAction instance from a dictionary.
+        
+        Args:
+            data: Dictionary containing rule action data
+            
+        Returns:
+            RuleAction: Shared RuleAction instance
+        """
+        return shared_rule_action(
+            data.get("id", ""), data.get("name", ""), data.get("active", False)
+        )
+
     def to_dict(self) -> Dict:
         """Convert the rule action to a dictionary.
         
@@ -24,7 +48,22 @@ class RuleAction:
         }
 
 
-@dataclass
+@lru_cache(maxsize=RULE_ACTION_CACHE_SIZE)
+def shared_rule_action(id: str, name: str, active: bool) -> RuleAction:
+    """Get the shared RuleAction instance for the given fields.
+    
+    Args:
+        id: Action ID
+        name: Action name
+        active: Whether the action is active
+        
+    Returns:
+        RuleAction: Instance shared by all rules referencing the same action
+    """
+    return RuleAction(id, name, active)
+
+
+@model_dataclass
 class Rule:
     """Represents a rule in the Sublime Security Platform."""
     
@@ -60,11 +99,10 @@ class Rule:
     feed_external_rule_id: Optional[str] = None
     
     # Related objects
-    actions: List[RuleAction] = field(default_factory=list)
-    exclusions: List[str] = field(default_factory=list)
-    
-    # Additional properties for display
-    has_exclusions: bool = False
+    # Rules without related objects share an empty tuple instead of each
+    # holding its own empty list
+    actions: Sequence[RuleAction] = ()
+    exclusions: Sequence[str] = ()
     
     @classmethod
     def from_dict(cls, data: Dict) -> "Rule":
@@ -77,55 +115,54 @@ class Rule:
             Rule: New Rule instance
         """
         # Process actions if they exist
-        actions = []
-        if "actions" in data and data["actions"]:
-            actions = [
-                RuleAction(
-                    id=action.get("id", ""),
-                    name=action.get("name", ""),
-                    active=action.get("active", False)
-                )
-                for action in data["actions"]
-            ]
+        actions = data.get("actions")
+        actions = list(map(RuleAction.from_dict, actions)) if actions else ()
         
         # Process exclusions if they exist
-        exclusions = []
-        if "exclusions" in data and data["exclusions"]:
-            exclusions = data["exclusions"]
-        
-        return cls(
-            id=data.get("id", ""),
-            org_id=data.get("org_id", ""),
-            full_type=data.get("full_type", ""),
-            type=data.get("type", ""),
-            active=data.get("active", False),
-            passive=data.get("passive", False),
-            source=data.get("source", ""),
-            source_md5=data.get("source_md5", ""),
-            name=data.get("name", ""),
-            created_at=data.get("created_at", ""),
-            updated_at=data.get("updated_at", ""),
-            active_updated_at=data.get("active_updated_at", ""),
-            description=data.get("description"),
-            severity=data.get("severity"),
-            authors=data.get("authors"),
-            references=data.get("references"),
-            tags=data.get("tags"),
-            false_positives=data.get("false_positives"),
-            maturity=data.get("maturity"),
-            label=data.get("label"),
-            created_by_api_request_id=data.get("created_by_api_request_id"),
-            created_by_org_id=data.get("created_by_org_id"),
-            created_by_org_name=data.get("created_by_org_name"),
-            created_by_user_id=data.get("created_by_user_id"),
-            created_by_user_name=data.get("created_by_user_name"),
-            immutable=data.get("immutable"),
-            feed_id=data.get("feed_id"),
-            feed_external_rule_id=data.get("feed_external_rule_id"),
-            actions=actions,
-            exclusions=exclusions,
-            has_exclusions=bool(exclusions)
-        )
+        exclusions = data.get("exclusions") or ()
+        
+        # Assign fields directly, skipping keyword argument binding
+        rule = cls.__new__(cls)
+        rule.id = data.get("id", "")
+        rule.org_id = data.get("org_id", "")
+        rule.full_type = intern_value(data.get("full_type", ""))
+        rule.type = intern_value(data.get("type", ""))
+        rule.active = data.get("active", False)
+        rule.passive = data.get("passive", False)
+        rule.source = data.get("source", "")
+        rule.source_md5 = data.get("source_md5", "")
+        rule.name = data.get("name", "")
+        rule.created_at = data.get("created_at", "")
+        rule.updated_at = data.get("updated_at", "")
+        rule.active_updated_at = data.get("active_updated_at", "")
+        rule.description = data.get("description")
+        rule.severity = intern_value(data.get("severity"))
+        rule.authors = data.get("authors")
+        rule.references = data.get("references")
+        rule.tags = data.get("tags")
+        rule.false_positives = data.get("false_positives")
+        rule.maturity = data.get("maturity")
+        rule.label = data.get("label")
+        rule.created_by_api_request_id = data.get("created_by_api_request_id")
+        rule.created_by_org_id = data.get("created_by_org_id")
+        rule.created_by_org_name = data.get("created_by_org_name")
+        rule.created_by_user_id = data.get("created_by_user_id")
+        rule.created_by_user_name = data.get("created_by_user_name")
+        rule.immutable = data.get("immutable")
+        rule.feed_id = data.get("feed_id")
+        rule.feed_external_rule_id = data.get("feed_external_rule_id")
+        rule.actions = actions
+        rule.exclusions = exclusions
+        return rule
+    
+    @property
+    def has_exclusions(self) -> bool:
+        """Whether the rule has any exclusions, for display.
+        
+        Returns:
+            bool: True if the rule has exclusions
+        """
+        return bool(self.exclusions)
     
     def to_dict(self) -> Dict:
         """Convert the rule to a dictionary.
@@ -1,10 +1,8 @@
 """Base classes for output formatting."""
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from typing import Any, Dict, List, Optional
 
-from rich.console import Console
-from rich.table import Table
-
 
 class OutputFormatter(ABC):
     """Abstract base class for output formatters."""
@@ -63,6 +61,32 @@ class OutputFormatter(ABC):
         pass
 
 
+@contextmanager
+def auto_confirm(formatter: OutputFormatter, enabled: bool = True):
+    """Temporarily make a formatter confirm every prompt without asking.
+    
+    The formatter's original prompt is restored on exit, even if the
+    wrapped code raises.
+    
+    Args:
+        formatter: Formatter whose prompts should be confirmed
+        enabled: Whether to auto-confirm; if False the formatter is unchanged
+        
+    Yields:
+        OutputFormatter: The formatter
+    """
+    if not enabled:
+        yield formatter
+        return
+    
+    original_prompt = formatter.prompt_confirmation
+    formatter.prompt_confirmation = lambda _: True
+    try:
+        yield formatter
+    finally:
+        formatter.prompt_confirmation = original_prompt
+
+
 class CommandResult:
     """Represents the result of a command operation."""
     
@@ -1,15 +1,23 @@
 """Factory for creating output formatters."""
+from functools import lru_cache
 from typing import Optional
 
 from sublime_migration_cli.presentation.base import OutputFormatter
-from sublime_migration_cli.presentation.interactive import InteractiveFormatter
-from sublime_migration_cli.presentation.json_output import JsonFormatter
-from sublime_migration_cli.presentation.markdown import MarkdownFormatter
+
+# Output formats supported by create_formatter
+SUPPORTED_FORMATS = frozenset({"json", "table", "interactive", "markdown"})
 
 
 def create_formatter(output_format: str, use_pager: bool = True, output_file: Optional[str] = None) -> OutputFormatter:
     """Create an output formatter based on the specified format.
     
+    The JSON formatter has no state, so a single instance is shared by all
+    callers (see get_json_formatter). Markdown and table formatters are
+    created per call: markdown ones are bound to an output file, and table
+    ones own a rich Console, so state set by one command (prompt overrides,
+    pager or live displays) cannot leak into later commands in the same
+    process, such as the sub-migrations run by ``migrate all``.
+    
     Args:
         output_format: The desired output format ("table", "json", "markdown", etc.)
         use_pager: Whether to use a pager for large outputs (interactive mode only)
@@ -21,11 +29,32 @@ def create_formatter(output_format: str, use_pager: bool = True, output_file: Op
     Raises:
         ValueError: If the output format is not supported
     """
-    if output_format == "json":
-        return JsonFormatter()
-    elif output_format in ("table", "interactive"):
-        return InteractiveFormatter(use_pager=use_pager)
-    elif output_format == "markdown":
+    if output_format not in SUPPORTED_FORMATS:
+        raise ValueError(f"Unsupported output format: {output_format}")
+    
+    # Formatter modules are imported on first use, so that only the selected
+    # one is loaded (JSON and markdown output never import rich)
+    if output_format == "markdown":
+        from sublime_migration_cli.presentation.markdown import MarkdownFormatter
         return MarkdownFormatter(output_file=output_file)
-    else:
-        raise ValueError(f"Unsupported output format: {output_format}")
\ No newline at end of file
+    if output_format == "json":
+        return get_json_formatter()
+    
+    from sublime_migration_cli.presentation.interactive import InteractiveFormatter
+    return InteractiveFormatter(use_pager=use_pager)
+
+
+@lru_cache(maxsize=1)
+def get_json_formatter() -> OutputFormatter:
+    """Get the shared JSON formatter.
+    
+    The instance is shared by every caller in the process, so JsonFormatter
+    must stay stateless: it keeps no attributes, and its only override,
+    auto_confirm's prompt_confirmation patch, matches its default of always
+    confirming and is restored on exit.
+    
+    Returns:
+        OutputFormatter: The shared JSON formatter
+    """
+    from sublime_migration_cli.presentation.json_output import JsonFormatter
+    return JsonFormatter()
@@ -1,16 +1,120 @@
 """Interactive output formatter using Rich."""
-from typing import Any, Dict, List, Optional
+import json
+from typing import Any, Callable, Dict, List, Optional
 from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain
+from operator import methodcaller
 
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.table import Table
-from rich.panel import Panel
+from rich.text import Text
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from rich.prompt import Confirm
 
 from sublime_migration_cli.presentation.base import OutputFormatter, CommandResult
 
 
+# Number of rows above which output is shown in a pager, if enabled
+PAGER_ROW_THRESHOLD = 20
+
+# Maximum number of distinct keys whose display labels are cached
+LABEL_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=LABEL_CACHE_SIZE)
+def format_label(key: str) -> str:
+    """Turn a data key or migration type into a display label.
+    
+    Args:
+        key: Key such as "created_at" or "rule-exclusions"
+        
+    Returns:
+        str: Title-cased label with underscores replaced by spaces
+    """
+    return key.replace("_", " ").title()
+
+
+def _no_item_cells(item: Dict) -> List[str]:
+    """Return no extra cells, for migration types without specific columns."""
+    return []
+
+
+def _action_item_cells(item: Dict) -> List[str]:
+    """Return the type-specific cells of an action migration row."""
+    return [item.get("type", "")]
+
+
+def _list_item_cells(item: Dict) -> List[str]:
+    """Return the type-specific cells of a list migration row."""
+    return [item.get("type", ""), str(item.get("entries", 0))]
+
+
+def _exclusion_item_cells(item: Dict) -> List[str]:
+    """Return the type-specific cells of an exclusion migration row."""
+    return [
+        item.get("scope", ""),
+        "✓" if item.get("active", False) else "✗",
+        item.get("created_by", ""),
+    ]
+
+
+def _feed_item_cells(item: Dict) -> List[str]:
+    """Return the type-specific cells of a feed migration row."""
+    return [
+        item.get("git_url", ""),
+        item.get("git_branch", ""),
+        "✓" if item.get("is_system", False) else "✗",
+    ]
+
+
+def _rule_item_cells(item: Dict) -> List[str]:
+    """Return the type-specific cells of a rule migration row."""
+    return [item.get("type", ""), item.get("severity", "")]
+
+
+def _rule_exclusion_item_cells(item: Dict) -> List[str]:
+    """Return the type-specific cells of a rule exclusion migration row."""
+    # Format exclusions count or list for rule-exclusions
+    exclusions = item.get("exclusions", [])
+    if isinstance(exclusions, list):
+        return [f"{len(exclusions)} exclusions"]
+    return [str(exclusions)]
+
+
+def section_heading(title: str) -> Text:
+    """Build a bold section heading preceded by a blank line.
+    
+    Args:
+        title: Heading text
+        
+    Returns:
+        Text: Styled heading, built without going through the markup parser
+    """
+    return Text.assemble("\n", (title, "bold"))
+
+
+# Keys of new items in migration previews, mapped to the migration type and
+# the keys of its update and skipped items
+MIGRATION_PREVIEW_KEYS = {
+    "new_actions": ("actions", "update_actions", None),
+    "new_lists": ("lists", "update_lists", None),
+    "new_exclusions": ("exclusions", "update_exclusions", None),
+    "new_feeds": ("feeds", "update_feeds", None),
+    "new_rules": ("rules", "update_rules", "skipped_rules"),
+}
+
+# Builders for the type-specific cells of migration item rows, by migration type
+ITEM_CELL_BUILDERS = {
+    "actions": _action_item_cells,
+    "lists": _list_item_cells,
+    "exclusions": _exclusion_item_cells,
+    "feeds": _feed_item_cells,
+    "rules": _rule_item_cells,
+    "rule-exclusions": _rule_exclusion_item_cells,
+}
+
+
 class InteractiveFormatter(OutputFormatter):
     """Formatter for interactive console output using Rich."""
     
@@ -55,7 +159,7 @@ class InteractiveFormatter(OutputFormatter):
             if isinstance(details, str):
                 self.console.print(f"[red]{details}[/]")
             else:
-                self.console.print("\n[bold]Details:[/]")
+                self.console.print(section_heading("Details:"))
                 self._output_data(details)
     
     def output_success(self, message: str) -> None:
@@ -77,12 +181,19 @@ class InteractiveFormatter(OutputFormatter):
         Returns:
             A progress context manager
         """
-        with Progress(
+        columns = [
             SpinnerColumn(),
             TextColumn(f"[bold blue]{description}"),
             BarColumn(),
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TextColumn("({task.completed}/{task.total})") if total is not None else TextColumn(""),
+        ]
+        
+        # Only show the counts when the total is known
+        if total is not None:
+            columns.append(TextColumn("({task.completed}/{task.total})"))
+        
+        with Progress(
+            *columns,
             console=self.console,
             transient=True
         ) as progress:
@@ -106,6 +217,18 @@ class InteractiveFormatter(OutputFormatter):
         Args:
             data: The data to output
         """
+        # Check for migration data (has specific structure) before generic dicts
+        if isinstance(data, dict) and any(key in data for key in [
+                "new_actions", "new_lists", "new_exclusions", "new_feeds", "new_rules", "rules_to_update"
+            ]) and "summary" in data:
+            self._output_migration_preview(data)
+            return
+        
+        # Check for migration plan data
+        if isinstance(data, dict) and "migration_plan" in data:
+            self._output_migration_plan(data)
+            return
+        
         # Handle Rule objects specially
         if hasattr(data, "__class__") and data.__class__.__name__ == "Rule":
             self._output_rule(data)
@@ -119,9 +242,8 @@ class InteractiveFormatter(OutputFormatter):
         
         # Handle lists of model objects
         if isinstance(data, list) and data and hasattr(data[0], "to_dict") and callable(getattr(data[0], "to_dict")):
-            # Convert list of models to list of dictionaries
-            dict_list = [item.to_dict() for item in data]
-            self._output_table_from_dict_list(dict_list)
+            # Convert each model to a dictionary as its row is added
+            self._output_table_from_dict_list(data, to_dict=methodcaller("to_dict"))
             return
             
         if isinstance(data, list) and data and hasattr(data[0], "__class__") and data[0].__class__.__name__ == "Rule":
@@ -141,18 +263,6 @@ class InteractiveFormatter(OutputFormatter):
         else:
             # Other data types
             self.console.print(data)
-
-        # Check for migration data (has specific structure)
-        if isinstance(data, dict) and any(key in data for key in [
-                "new_actions", "new_lists", "new_exclusions", "new_feeds", "new_rules", "rules_to_update"
-            ]) and "summary" in data:
-            self._output_migration_preview(data)
-            return
-        
-        # Check for migration plan data
-        if isinstance(data, dict) and "migration_plan" in data:
-            self._output_migration_plan(data)
-            return
     
     def _output_table(self, table: Table) -> None:
         """Output a Rich table.
@@ -160,32 +270,48 @@ class InteractiveFormatter(OutputFormatter):
         Args:
             table: The Rich table to output
         """
-        if self.use_pager and table.row_count > 20:
+        self._print_paged(table, table.row_count)
+    
+    def _print_paged(self, renderable: RenderableType, row_count: int) -> None:
+        """Print a renderable, through the pager if it is long.
+        
+        Args:
+            renderable: The renderable to print
+            row_count: Approximate number of rows the renderable takes up
+        """
+        if self.use_pager and row_count > PAGER_ROW_THRESHOLD:
             with self.console.pager():
-                self.console.print(table)
+                self.console.print(renderable)
         else:
-            self.console.print(table)
+            self.console.print(renderable)
     
-    def _output_table_from_dict_list(self, data: List[Dict]) -> None:
+    def _output_table_from_dict_list(
+        self, data: List, to_dict: Optional[Callable[[Any], Dict]] = None
+    ) -> None:
         """Create and output a table from a list of dictionaries.
         
         Args:
-            data: List of dictionaries
+            data: List of dictionaries, or of objects converted with to_dict
+            to_dict: Optional function converting each item to a dictionary,
+                applied row by row so no converted list is built
         """
         if not data:
             return
         
+        rows = map(to_dict, data) if to_dict else iter(data)
+        first = next(rows)
+        
         # Extract column names from the first dictionary
-        columns = list(data[0].keys())
+        columns = list(first.keys())
         
         table = Table(title=f"Results ({len(data)} items)")
         
         # Add columns
         for column in columns:
-            table.add_column(column.replace("_", " ").title())
+            table.add_column(format_label(column))
         
         # Add rows
-        for item in data:
+        for item in chain((first,), rows):
             row_values = []
             for column in columns:
                 value = item.get(column, "")
@@ -213,13 +339,12 @@ class InteractiveFormatter(OutputFormatter):
         
         for key, value in data.items():
             # Format the key
-            formatted_key = key.replace("_", " ").title()
+            formatted_key = format_label(key)
             
             # Format the value based on type
             if isinstance(value, bool):
                 formatted_value = "✓" if value else "✗"
             elif isinstance(value, (list, dict)):
-                import json
                 formatted_value = json.dumps(value, indent=2)
             elif value is None:
                 formatted_value = ""
@@ -236,14 +361,18 @@ class InteractiveFormatter(OutputFormatter):
         Args:
             rule: Rule object to display
         """
+        # Imported here since rich.syntax pulls in pygments, which is only
+        # needed when a rule is shown
         from rich.syntax import Syntax
-        from rich.panel import Panel
+        
+        # Collect the sections and print them in one pass
+        renderables: List[RenderableType] = []
         
         # Display basic rule info
-        self.console.print(f"[bold]Rule:[/] {rule.name}")
+        renderables.append(Text.assemble(("Rule:", "bold"), " ", rule.name))
         
         # Main info section
-        self.console.print("\n[bold]Basic Information:[/]")
+        renderables.append(section_heading("Basic Information:"))
         basic_table = Table(show_header=False)
         basic_table.add_column("Property", style="cyan")
         basic_table.add_column("Value")
@@ -265,11 +394,11 @@ class InteractiveFormatter(OutputFormatter):
         for field, value in basic_fields:
             basic_table.add_row(field, str(value))
         
-        self.console.print(basic_table)
+        renderables.append(basic_table)
         
         # Actions section
         if rule.actions:
-            self.console.print("\n[bold]Associated Actions:[/]")
+            renderables.append(section_heading("Associated Actions:"))
             actions_table = Table()
             actions_table.add_column("ID", style="dim")
             actions_table.add_column("Name", style="green")
@@ -282,23 +411,23 @@ class InteractiveFormatter(OutputFormatter):
                     "✓" if action.active else "✗"
                 )
             
-            self.console.print(actions_table)
+            renderables.append(actions_table)
         
         # Exclusions section
         if rule.exclusions:
-            self.console.print("\n[bold]Rule Exclusions:[/]")
+            renderables.append(section_heading("Rule Exclusions:"))
             exclusions_table = Table()
             exclusions_table.add_column("Exclusion", style="green")
             
             for exclusion in rule.exclusions:
                 exclusions_table.add_row(exclusion)
             
-            self.console.print(exclusions_table)
+            renderables.append(exclusions_table)
         
         # Source query section
-        self.console.print("\n[bold]Source Query:[/]")
+        renderables.append(section_heading("Source Query:"))
         source_syntax = Syntax(rule.source, "sql", theme="monokai", line_numbers=True)
-        self.console.print(source_syntax)
+        renderables.append(source_syntax)
         
         # Additional metadata
         meta_fields = []
@@ -312,7 +441,7 @@ class InteractiveFormatter(OutputFormatter):
             meta_fields.append(("Tags", ", ".join(rule.tags) if isinstance(rule.tags, list) else rule.tags))
         
         if meta_fields:
-            self.console.print("\n[bold]Additional Metadata:[/]")
+            renderables.append(section_heading("Additional Metadata:"))
             meta_table = Table(show_header=False)
             meta_table.add_column("Property", style="cyan")
             meta_table.add_column("Value")
@@ -320,7 +449,13 @@ class InteractiveFormatter(OutputFormatter):
             for field, value in meta_fields:
                 meta_table.add_row(field, str(value))
             
-            self.console.print(meta_table)
+            renderables.append(meta_table)
+        
+        # Page long rules, measured by their source and table rows
+        row_count = (
+            len(rule.source.splitlines()) + len(rule.actions) + len(rule.exclusions)
+        )
+        self._print_paged(Group(*renderables), row_count)
 
     def _output_rules_list(self, rules: List) -> None:
         """Output a list of rules.
@@ -337,13 +472,15 @@ class InteractiveFormatter(OutputFormatter):
         table.add_column("Active", style="cyan", justify="center")
         table.add_column("Actions", style="yellow", justify="right")
         
-        if any(rule.has_exclusions for rule in rules):
+        # Only show the exclusions column if any rule has exclusions
+        show_exclusions = any(rule.has_exclusions for rule in rules)
+        if show_exclusions:
             table.add_column("Exclusions", style="red", justify="center")
         
         # Add rules to the table
         for rule in rules:
-            # Count actions
-            action_count = len([a for a in rule.actions if a.active])
+            # Count active actions
+            action_count = sum(1 for a in rule.actions if a.active)
             
             # Prepare row data
             row_data = [
@@ -356,7 +493,7 @@ class InteractiveFormatter(OutputFormatter):
             ]
             
             # Add exclusions column if any rule has exclusions
-            if any(rule.has_exclusions for rule in rules):
+            if show_exclusions:
                 row_data.append("✓" if rule.has_exclusions else "")
             
             table.add_row(*row_data)
@@ -378,48 +515,53 @@ class InteractiveFormatter(OutputFormatter):
             self.console.print(data)
             return
         
+        # Collect the sections and print them in one pass
+        renderables: List[RenderableType] = []
+        
         # Display summary
         summary = data.get("summary", {})
-        self.console.print(f"\n[bold]Migration Summary:[/]")
+        renderables.append(section_heading("Migration Summary:"))
         
         # Different types have different summary fields
         if "new_count" in summary:
-            self.console.print(f"New items: {summary.get('new_count', 0)}")
+            renderables.append(f"New items: {summary.get('new_count', 0)}")
         if "update_count" in summary:
-            self.console.print(f"Updates: {summary.get('update_count', 0)}")
+            renderables.append(f"Updates: {summary.get('update_count', 0)}")
         if "actions_count" in summary:
-            self.console.print(f"Actions: {summary.get('actions_count', 0)}")
+            renderables.append(f"Actions: {summary.get('actions_count', 0)}")
         if "rules_count" in summary:
-            self.console.print(f"Rules: {summary.get('rules_count', 0)}")
+            renderables.append(f"Rules: {summary.get('rules_count', 0)}")
         if "skipped_count" in summary:
-            self.console.print(f"Skipped: {summary.get('skipped_count', 0)}")
+            renderables.append(f"Skipped: {summary.get('skipped_count', 0)}")
         if "skipped_rules_count" in summary:
-            self.console.print(f"Skipped rules: {summary.get('skipped_rules_count', 0)}")
+            renderables.append(f"Skipped rules: {summary.get('skipped_rules_count', 0)}")
         if "skipped_actions_count" in summary:
-            self.console.print(f"Skipped actions: {summary.get('skipped_actions_count', 0)}")
+            renderables.append(f"Skipped actions: {summary.get('skipped_actions_count', 0)}")
         if "total_count" in summary:
-            self.console.print(f"Total: {summary.get('total_count', 0)}")
+            renderables.append(f"Total: {summary.get('total_count', 0)}")
         
         # Display new items if any
         if new_items:
-            self._display_items_table(migration_type, "New", new_items)
+            renderables.extend(self._render_items_table(migration_type, "New", new_items))
         
         # Display update items if any
         if update_items:
             # For action-to-rule associations, use a special display format
             if migration_type == "actions-to-rules":
-                self._display_rule_action_associations(update_items)
+                renderables.extend(self._render_rule_action_associations(update_items))
             else:
-                self._display_items_table(migration_type, "Update", update_items)
+                renderables.extend(self._render_items_table(migration_type, "Update", update_items))
         
         # Display skipped items if any
         if skipped_items:
-            self._display_skipped_items(migration_type, skipped_items)
+            renderables.extend(self._render_skipped_items(migration_type, skipped_items))
         
         # Display results if available
         results = data.get("results")
         if results:
-            self._display_migration_results(results)
+            renderables.extend(self._render_migration_results(results))
+        
+        self.console.print(Group(*renderables))
 
     def _determine_migration_type(self, data: Dict) -> tuple[Optional[str], List, List, List]:
         """Determine migration type and extract relevant items.
@@ -430,35 +572,37 @@ class InteractiveFormatter(OutputFormatter):
         Returns:
             Tuple[str, List, List, List]: Migration type, new items, update items, skipped items
         """
-        if "new_actions" in data:
-            return "actions", data.get("new_actions", []), data.get("update_actions", []), []
-        elif "new_lists" in data:
-            return "lists", data.get("new_lists", []), data.get("update_lists", []), []
-        elif "new_exclusions" in data:
-            return "exclusions", data.get("new_exclusions", []), data.get("update_exclusions", []), []
-        elif "new_feeds" in data:
-            return "feeds", data.get("new_feeds", []), data.get("update_feeds", []), []
-        elif "new_rules" in data:
-            return "rules", data.get("new_rules", []), data.get("update_rules", []), data.get("skipped_rules", [])
-        elif "rules_to_update" in data and any("actions" in rule for rule in data.get("rules_to_update", [])):
-            return "actions-to-rules", [], data.get("rules_to_update", []), data.get("skipped_rules", []) + data.get("skipped_actions", [])
-        elif "rules_to_update" in data and any("exclusions" in rule for rule in data.get("rules_to_update", [])):
-            return "rule-exclusions", [], data.get("rules_to_update", []), data.get("skipped_rules", []) + data.get("skipped_exclusions", [])
+        # Previews of a single object type, checked in order
+        for new_key, (migration_type, update_key, skipped_key) in MIGRATION_PREVIEW_KEYS.items():
+            if new_key in data:
+                skipped_items = data.get(skipped_key, []) if skipped_key else []
+                return migration_type, data[new_key], data.get(update_key, []), skipped_items
+        
+        # Rule updates, told apart by what the rules are updated with
+        rules_to_update = data.get("rules_to_update")
+        if rules_to_update:
+            if any("actions" in rule for rule in rules_to_update):
+                return "actions-to-rules", [], rules_to_update, data.get("skipped_rules", []) + data.get("skipped_actions", [])
+            if any("exclusions" in rule for rule in rules_to_update):
+                return "rule-exclusions", [], rules_to_update, data.get("skipped_rules", []) + data.get("skipped_exclusions", [])
         
         return None, [], [], []
 
-    def _display_items_table(self, migration_type: str, action_type: str, items: List):
-        """Display a table of items to migrate.
+    def _render_items_table(self, migration_type: str, action_type: str, items: List) -> List[RenderableType]:
+        """Build the heading and table of items to migrate.
         
         Args:
             migration_type: Type of migration (actions, lists, etc.)
             action_type: Type of action (New, Update, etc.)
             items: List of items to display
+            
+        Returns:
+            List[RenderableType]: Renderables to print, empty if there are no items
         """
         if not items:
-            return
+            return []
             
-        self.console.print(f"\n[bold]{action_type} {migration_type.title()} to {action_type}:[/]")
+        heading = section_heading(f"{action_type} {format_label(migration_type)} to {action_type}:")
         table = Table()
         
         # Common columns for all migration types
@@ -485,65 +629,47 @@ class InteractiveFormatter(OutputFormatter):
         elif migration_type == "rule-exclusions":
             table.add_column("Exclusions", style="blue")
         
+        # Pick the type-specific cells once rather than per row
+        build_cells = ITEM_CELL_BUILDERS.get(migration_type, _no_item_cells)
+        
         # Add rows based on migration type
         for item in items:
-            
             item_name = item.get("rule_name", item.get("name", ""))
-            row_data = [item_name, item.get("status", "")]
-            
-            if migration_type == "actions":
-                row_data.append(item.get("type", ""))
-            elif migration_type == "lists":
-                row_data.append(item.get("type", ""))
-                row_data.append(str(item.get("entries", 0)))
-            elif migration_type == "exclusions":
-                row_data.append(item.get("scope", ""))
-                row_data.append("✓" if item.get("active", False) else "✗")
-                row_data.append(item.get("created_by", ""))
-            elif migration_type == "feeds":
-                row_data.append(item.get("git_url", ""))
-                row_data.append(item.get("git_branch", ""))
-                row_data.append("✓" if item.get("is_system", False) else "✗")
-            elif migration_type == "rules":
-                row_data.append(item.get("type", ""))
-                row_data.append(item.get("severity", ""))
-            elif migration_type == "rule-exclusions":
-                # Format exclusions count or list for rule-exclusions
-                exclusions = item.get("exclusions", [])
-                if isinstance(exclusions, list):
-                    exclusions_count = len(exclusions)
-                    row_data.append(f"{exclusions_count} exclusions")
-                else:
-                    row_data.append(str(exclusions))
-            
-            table.add_row(*row_data)
+            table.add_row(item_name, item.get("status", ""), *build_cells(item))
         
-        self.console.print(table)
+        return [heading, table]
 
-    def _display_rule_action_associations(self, rules_to_update: List):
-        """Display rule-action associations or rule-exclusions to migrate.
+    def _render_rule_action_associations(self, rules_to_update: List) -> List[RenderableType]:
+        """Build the heading and table of rule-action associations or rule-exclusions to migrate.
         
         Args:
             rules_to_update: List of rules to update with action associations or exclusions
+            
+        Returns:
+            List[RenderableType]: Renderables to print, empty if there are no rules
         """
         if not rules_to_update:
-            return
+            return []
         
         # Determine if these are action associations or exclusions based on the first item
         is_actions = "actions" in rules_to_update[0] if rules_to_update else False
         is_exclusions = "exclusions" in rules_to_update[0] if rules_to_update else False
         
+        # Pick the details column and how its values are joined once for all rows
         if is_actions:
             title = "Rule-Action Associations"
             col2_title = "Actions"
+            details_key, separator = "actions", ", "
         elif is_exclusions:
             title = "Rule Exclusions"
             col2_title = "Exclusions"
+            details_key, separator = "exclusions", "\n"
         else:
             title = "Rule Updates"
             col2_title = "Details"
+            details_key, separator = None, ""
             
-        self.console.print(f"\n[bold]{title} to Update:[/]")
+        heading = section_heading(f"{title} to Update:")
         table = Table()
         
         table.add_column("Rule Name", style="green")
@@ -553,12 +679,7 @@ class InteractiveFormatter(OutputFormatter):
         ##### the rule name display issue w/ rule_exclusions is somewhere here
         ##### tip: rules works well, compare the json outputs
         for rule in rules_to_update:
-            details = ""
-            if is_actions:
-                details = ", ".join(rule.get("actions", []))
-            elif is_exclusions:
-                details = "\n".join(rule.get("exclusions", []))
-            
+            details = separator.join(rule.get(details_key, [])) if details_key else ""
             rule_name = rule.get("rule_name", rule.get("name", ""))
         
             table.add_row(
@@ -567,19 +688,22 @@ class InteractiveFormatter(OutputFormatter):
                 rule.get("status", "")
             )
         
-        self.console.print(table)
+        return [heading, table]
 
-    def _display_skipped_items(self, migration_type: str, skipped_items: List):
-        """Display skipped items.
+    def _render_skipped_items(self, migration_type: str, skipped_items: List) -> List[RenderableType]:
+        """Build the heading and table of skipped items.
         
         Args:
             migration_type: Type of migration
             skipped_items: List of skipped items
+            
+        Returns:
+            List[RenderableType]: Renderables to print, empty if nothing was skipped
         """
         if not skipped_items:
-            return
+            return []
             
-        self.console.print(f"\n[bold]Skipped {migration_type.title()}:[/]")
+        heading = section_heading(f"Skipped {format_label(migration_type)}:")
         table = Table()
         
         if migration_type in ["actions-to-rules", "rule-exclusions"]:
@@ -619,30 +743,33 @@ class InteractiveFormatter(OutputFormatter):
                     item.get("reason", "")
                 )
         
-        self.console.print(table)
+        return [heading, table]
 
-    def _display_migration_results(self, results: Dict):
-        """Display migration results.
+    def _render_migration_results(self, results: Dict) -> List[RenderableType]:
+        """Build the migration results section.
         
         Args:
             results: Migration results
+            
+        Returns:
+            List[RenderableType]: Renderables to print
         """
-        self.console.print("\n[bold]Migration Results:[/]")
+        renderables: List[RenderableType] = [section_heading("Migration Results:")]
         
         # Display summary counts
         if "created" in results:
-            self.console.print(f"Created: {results.get('created', 0)}")
+            renderables.append(f"Created: {results.get('created', 0)}")
         if "updated" in results:
-            self.console.print(f"Updated: {results.get('updated', 0)}")
+            renderables.append(f"Updated: {results.get('updated', 0)}")
         if "skipped" in results:
-            self.console.print(f"Skipped: {results.get('skipped', 0)}")
+            renderables.append(f"Skipped: {results.get('skipped', 0)}")
         if "failed" in results:
-            self.console.print(f"Failed: {results.get('failed', 0)}")
+            renderables.append(f"Failed: {results.get('failed', 0)}")
         
         # Display details if available
         details = results.get("details", [])
         if details:
-            self.console.print("\n[bold]Operation Details:[/]")
+            renderables.append(section_heading("Operation Details:"))
             details_table = Table()
             details_table.add_column("Name", style="green")
             details_table.add_column("Type", style="blue")
@@ -652,6 +779,11 @@ class InteractiveFormatter(OutputFormatter):
             for detail in details:
                 # Get reason or actions count for details column
                 detail_info = detail.get("reason", "")
+                if not detail_info and "exclusion_type" in detail:
+                    detail_info = (
+                        f"Failed to add exclusion {detail['exclusion_type']} "
+                        f"'{detail.get('exclusion_value', '')}': {detail.get('error', '')}"
+                    )
                 if not detail_info and "actions_count" in detail:
                     detail_info = f"{detail['actions_count']} actions"
                 
@@ -662,7 +794,9 @@ class InteractiveFormatter(OutputFormatter):
                     detail_info
                 )
             
-            self.console.print(details_table)
+            renderables.append(details_table)
+        
+        return renderables
 
     def _output_migration_plan(self, data: Dict) -> None:
         """Format and display migration plan data.
@@ -670,30 +804,33 @@ class InteractiveFormatter(OutputFormatter):
         Args:
             data: Migration plan data
         """
+        # Collect the sections and print them in one pass
+        renderables: List[RenderableType] = []
+        
         # Display connection info
         if "connection_info" in data:
             conn_info = data["connection_info"]
-            self.console.print("\n[bold]Connection Information:[/]")
-            self.console.print(f"Source: [green]{conn_info['source']['org_name']}[/] ({conn_info['source']['email']})")
-            self.console.print(f"Destination: [green]{conn_info['destination']['org_name']}[/] ({conn_info['destination']['email']})")
+            renderables.append(section_heading("Connection Information:"))
+            renderables.append(f"Source: [green]{conn_info['source']['org_name']}[/] ({conn_info['source']['email']})")
+            renderables.append(f"Destination: [green]{conn_info['destination']['org_name']}[/] ({conn_info['destination']['email']})")
         
         # Display migration plan
         if "migration_plan" in data:
-            self.console.print("\n[bold]Migration Plan:[/]")
+            renderables.append(section_heading("Migration Plan:"))
             plan_table = Table()
             plan_table.add_column("#", style="dim")
             plan_table.add_column("Component", style="green")
             plan_table.add_column("Status", style="cyan")
             
             for step in data["migration_plan"]:
-                status = "[yellow]Will Skip[/]" if step.get("will_skip") else "Will Migrate"
+                status = Text.assemble(("Will Skip", "yellow")) if step.get("will_skip") else "Will Migrate"
                 plan_table.add_row(str(step.get("step")), step.get("component"), status)
             
-            self.console.print(plan_table)
+            renderables.append(plan_table)
         
         # Display migration summary if available
         if "summary" in data:
-            self.console.print("\n[bold]Migration Summary:[/]")
+            renderables.append(section_heading("Migration Summary:"))
             summary_table = Table()
             summary_table.add_column("Component", style="green")
             summary_table.add_column("Status", style="cyan")
@@ -703,14 +840,16 @@ class InteractiveFormatter(OutputFormatter):
                 status_style = ""
                 
                 if status == "success":
-                    status_style = "[green]Success[/]"
+                    status_style = Text.assemble(("Success", "green"))
                 elif status == "failed":
-                    status_style = "[red]Failed[/]"
+                    status_style = Text.assemble(("Failed", "red"))
                 elif status == "skipped":
-                    status_style = "[yellow]Skipped[/]"
+                    status_style = Text.assemble(("Skipped", "yellow"))
                 else:
-                    status_style = "[gray]Not Run[/]"
+                    status_style = Text.assemble(("Not Run", "gray"))
                 
                 summary_table.add_row(item.get("component", ""), status_style)
             
-            self.console.print(summary_table)
\ No newline at end of file
+            renderables.append(summary_table)
+        
+        self.console.print(Group(*renderables))
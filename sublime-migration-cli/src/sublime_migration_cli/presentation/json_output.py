@@ -1,11 +1,13 @@
 """JSON output formatter."""
 import json
+from collections.abc import Iterator
 from typing import Any, Dict, List, Optional
 from contextlib import contextmanager
 
 import click
 
 from sublime_migration_cli.presentation.base import OutputFormatter, CommandResult
+from sublime_migration_cli.utils.serialization import HAS_ORJSON, json_dumps
 
 
 class JsonFormatter(OutputFormatter):
@@ -18,11 +20,59 @@ class JsonFormatter(OutputFormatter):
             result: The data to output (CommandResult or other)
         """
         if isinstance(result, CommandResult):
-            data_to_output = result.to_dict()
-            click.echo(json.dumps(self._prepare_data(data_to_output), indent=2))
+            self._write_json(result.to_dict())
         else:
             # Direct output of other data types
-            click.echo(json.dumps(self._prepare_data(result), indent=2))
+            self._write_json(result)
+    
+    def _write_json(self, data: Any) -> None:
+        """Write data to stdout as indented JSON.
+        
+        With orjson installed the document is encoded in one fast call.
+        Otherwise it is written in chunks as it is encoded rather than built
+        as one string. Either way models are converted as they are reached
+        rather than copied up front, and iterators such as generators are
+        written as JSON arrays.
+        
+        Args:
+            data: The data to output
+        """
+        if HAS_ORJSON:
+            # Flush pending text output so it isn't reordered after the bytes
+            click.get_text_stream("stdout").flush()
+            stream = click.get_binary_stream("stdout")
+            stream.write(json_dumps(data, indent=True, default=self._encode_default) + b"\n")
+            stream.flush()
+            return
+        
+        stream = click.get_text_stream("stdout")
+        encoder = json.JSONEncoder(indent=2, default=self._encode_default)
+        for chunk in encoder.iterencode(data):
+            stream.write(chunk)
+        stream.write("\n")
+        stream.flush()
+    
+    def _encode_default(self, obj: Any) -> Any:
+        """Convert objects the JSON encoder doesn't handle natively.
+        
+        Args:
+            obj: Object to convert
+            
+        Returns:
+            JSON-serializable data
+            
+        Raises:
+            TypeError: If the object cannot be converted
+        """
+        # Handle dataclasses or objects with to_dict method
+        if hasattr(obj, "to_dict"):
+            return obj.to_dict()
+        
+        # Handle iterators such as generators
+        if isinstance(obj, Iterator):
+            return list(obj)
+        
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
     
     def output_error(self, error_message: str, details: Optional[Any] = None) -> None:
         """Output an error message as JSON.
@@ -37,9 +87,9 @@ class JsonFormatter(OutputFormatter):
         }
         
         if details:
-            error_data["error_details"] = self._prepare_data(details)
+            error_data["error_details"] = details
         
-        click.echo(json.dumps(error_data, indent=2))
+        self._write_json(error_data)
     
     def output_success(self, message: str) -> None:
         """Output a success message as JSON.
@@ -52,7 +102,7 @@ class JsonFormatter(OutputFormatter):
             "message": message
         }
         
-        click.echo(json.dumps(success_data, indent=2))
+        self._write_json(success_data)
     
     @contextmanager
     def create_progress(self, description: str, total: Optional[int] = None):
@@ -86,27 +136,3 @@ class JsonFormatter(OutputFormatter):
             bool: Always True in JSON mode
         """
         return True
-    
-    def _prepare_data(self, data: Any) -> Any:
-        """Prepare data for JSON serialization.
-        
-        Args:
-            data: The data to prepare
-            
-        Returns:
-            JSON-serializable data
-        """
-        # Handle dataclasses or objects with to_dict method
-        if hasattr(data, "to_dict"):
-            return self._prepare_data(data.to_dict())
-        
-        # Handle lists
-        if isinstance(data, list):
-            return [self._prepare_data(item) for item in data]
-        
-        # Handle dictionaries
-        if isinstance(data, dict):
-            return {k: self._prepare_data(v) for k, v in data.items()}
-        
-        # Handle other types
-        return data
\ No newline at end of file
@@ -1,11 +1,45 @@
 """Markdown output formatter for Sublime CLI reports."""
 import os
+import sys
 import datetime
-from typing import Any, Dict, List, Optional, Union
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Union
 
 from sublime_migration_cli.presentation.base import OutputFormatter, CommandResult
 
 
+# Suffix of the temporary file a report is written to before it replaces the output file
+PARTIAL_REPORT_SUFFIX = ".partial"
+
+
+class LineWriter:
+    """Writes markdown lines to a stream as soon as they are appended.
+    
+    Lines are separated by newlines, without one after the last line, so the
+    output matches joining the lines together.
+    """
+    
+    def __init__(self, stream: TextIO):
+        """Initialize with the stream to write to.
+        
+        Args:
+            stream: Text stream receiving the lines
+        """
+        self.stream = stream
+        self.started = False
+    
+    def append(self, line: str) -> None:
+        """Write a line to the stream.
+        
+        Args:
+            line: Line to write, without its trailing newline
+        """
+        if self.started:
+            self.stream.write("\n")
+        self.started = True
+        self.stream.write(line)
+
+
 class MarkdownFormatter(OutputFormatter):
     """Formatter for markdown output, primarily for reports."""
     
@@ -16,7 +50,7 @@ class MarkdownFormatter(OutputFormatter):
             output_file: Optional file path to write markdown output to
         """
         self.output_file = output_file
-        self.buffer = []
+        self.buffer = None
     
     def output_result(self, result: Any) -> None:
         """Output a result in markdown format.
@@ -24,11 +58,11 @@ class MarkdownFormatter(OutputFormatter):
         Args:
             result: The data to output (CommandResult or other)
         """
-        if isinstance(result, CommandResult):
-            # Clear buffer
-            self.buffer = []
-            
-            if result.success:
+        with self._open_output():
+            if not isinstance(result, CommandResult):
+                # Direct output of other data types
+                self._output_data(result)
+            elif result.success:
                 # Add title
                 self.buffer.append("# " + result.message + "\n")
                 
@@ -40,15 +74,7 @@ class MarkdownFormatter(OutputFormatter):
                 if result.notes:
                     self.buffer.append("\n> " + result.notes)
             else:
-                self.output_error(result.message, result.error_details)
-            
-            # Write to file or stdout
-            self._write_output()
-        else:
-            # Direct output of other data types
-            self.buffer = []
-            self._output_data(result)
-            self._write_output()
+                self._format_error(result.message, result.error_details)
     
     def output_error(self, error_message: str, details: Optional[Any] = None) -> None:
         """Output an error message in markdown format.
@@ -57,7 +83,16 @@ class MarkdownFormatter(OutputFormatter):
             error_message: The main error message
             details: Additional error details (optional)
         """
-        self.buffer = []
+        with self._open_output():
+            self._format_error(error_message, details)
+    
+    def _format_error(self, error_message: str, details: Optional[Any] = None) -> None:
+        """Format an error message in markdown.
+        
+        Args:
+            error_message: The main error message
+            details: Additional error details (optional)
+        """
         self.buffer.append("# Error: " + error_message + "\n")
         
         if details:
@@ -66,8 +101,6 @@ class MarkdownFormatter(OutputFormatter):
             else:
                 self.buffer.append("## Details\n")
                 self._output_data(details)
-        
-        self._write_output()
     
     def output_success(self, message: str) -> None:
         """Output a success message in markdown format.
@@ -75,9 +108,8 @@ class MarkdownFormatter(OutputFormatter):
         Args:
             message: The success message
         """
-        self.buffer = []
-        self.buffer.append("# " + message + "\n")
-        self._write_output()
+        with self._open_output():
+            self.buffer.append("# " + message + "\n")
     
     def create_progress(self, description: str, total: Optional[int] = None):
         """Create a 'progress indicator' for markdown output (no-op).
@@ -113,16 +145,41 @@ class MarkdownFormatter(OutputFormatter):
         """
         return True
     
-    def _write_output(self) -> None:
-        """Write the buffer contents to file or stdout."""
-        content = "\n".join(self.buffer)
+    @contextmanager
+    def _open_output(self) -> Iterator[LineWriter]:
+        """Direct lines appended to the buffer to the output file or stdout.
+        
+        Lines are written as they are generated rather than collected and
+        joined, so large reports are never held in memory as a whole. File
+        output goes to a temporary file next to the output file, which only
+        replaces it once the report is complete, so a failure part way through
+        leaves any earlier report in place.
         
+        Yields:
+            LineWriter: Writer the buffer is set to while the context is open
+        """
         if self.output_file:
-            with open(self.output_file, "w") as f:
-                f.write(content)
+            partial_file = self.output_file + PARTIAL_REPORT_SUFFIX
+            try:
+                with open(partial_file, "w") as f:
+                    self.buffer = LineWriter(f)
+                    yield self.buffer
+                os.replace(partial_file, self.output_file)
+            except BaseException:
+                if os.path.exists(partial_file):
+                    os.remove(partial_file)
+                raise
+            finally:
+                self.buffer = None
             print(f"Report written to: {self.output_file}")
         else:
-            print(content)
+            self.buffer = LineWriter(sys.stdout)
+            try:
+                yield self.buffer
+                # End with a newline, as printing the joined report did
+                sys.stdout.write("\n")
+            finally:
+                self.buffer = None
     
     def _output_data(self, data: Any) -> None:
         """Output data based on its type.
@@ -9,6 +9,8 @@ from sublime_migration_cli.utils.api import (
 )
 
 from sublime_migration_cli.utils.filtering import (
+    parse_id_set,
+    filter_by_id_sets,
     filter_by_ids,
     filter_by_types,
     filter_by_creator,
@@ -29,6 +31,16 @@ from sublime_migration_cli.utils.errors import (
     ErrorHandler,
 )
 
+from sublime_migration_cli.utils.rate_limit import (
+    TokenBucket,
+)
+
+from sublime_migration_cli.utils.serialization import (
+    content_digest,
+    json_dumps,
+    json_loads,
+)
+
 __all__ = [
     # API utilities
     'PaginatedFetcher',
@@ -38,6 +50,8 @@ __all__ = [
     'extract_total_from_key',
     
     # Filter utilities
+    'parse_id_set',
+    'filter_by_id_sets',
     'filter_by_ids',
     'filter_by_types',
     'filter_by_creator',
@@ -55,4 +69,12 @@ __all__ = [
     'MigrationError',
     'handle_api_error',
     'ErrorHandler',
+    
+    # Rate limiting
+    'TokenBucket',
+    
+    # Serialization
+    'content_digest',
+    'json_dumps',
+    'json_loads',
 ]
\ No newline at end of file
@@ -1,5 +1,6 @@
 """Utilities for working with the Sublime Security API."""
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar, Union
 from contextlib import nullcontext
 
 from sublime_migration_cli.presentation.base import OutputFormatter
@@ -42,6 +43,83 @@ class PaginatedFetcher:
         Returns:
             List[T]: All items from the paginated endpoint
         """
+        all_items = []
+        for page_items in self.iter_pages(
+            endpoint,
+            params=params,
+            progress_message=progress_message,
+            result_extractor=result_extractor,
+            total_extractor=total_extractor,
+            page_size=page_size,
+        ):
+            all_items.extend(page_items)
+        
+        return all_items
+    
+    def fetch_iter(self, 
+                   endpoint: str, 
+                   params: Optional[Dict] = None, 
+                   progress_message: Optional[str] = None,
+                   result_extractor: Optional[Callable[[Dict], List[T]]] = None,
+                   total_extractor: Optional[Callable[[Dict], int]] = None,
+                   page_size: int = 100,
+                   prefetch: bool = False) -> Iterator[T]:
+        """
+        Iterate over all items from a paginated API endpoint.
+        
+        Pages are fetched lazily as the iterator is consumed.
+        
+        Args:
+            endpoint: API endpoint path
+            params: Optional base parameters
+            progress_message: Message for progress display
+            result_extractor: Function to extract items from response
+            total_extractor: Function to extract total count from response
+            page_size: Number of items per page
+            prefetch: Whether to fetch the next page while the current one is consumed
+            
+        Yields:
+            T: Each item from the paginated endpoint
+        """
+        for page_items in self.iter_pages(
+            endpoint,
+            params=params,
+            progress_message=progress_message,
+            result_extractor=result_extractor,
+            total_extractor=total_extractor,
+            page_size=page_size,
+            prefetch=prefetch,
+        ):
+            yield from page_items
+    
+    def iter_pages(self, 
+                   endpoint: str, 
+                   params: Optional[Dict] = None, 
+                   progress_message: Optional[str] = None,
+                   result_extractor: Optional[Callable[[Dict], List[T]]] = None,
+                   total_extractor: Optional[Callable[[Dict], int]] = None,
+                   page_size: int = 100,
+                   prefetch: bool = False) -> Iterator[List[T]]:
+        """
+        Iterate over the pages of a paginated API endpoint.
+        
+        Lets callers index or aggregate items page by page without holding
+        the full result list in memory. With prefetch, the request for the
+        next page is sent before the current page is yielded, so network
+        round trips overlap with the caller's processing.
+        
+        Args:
+            endpoint: API endpoint path
+            params: Optional base parameters
+            progress_message: Message for progress display
+            result_extractor: Function to extract items from response
+            total_extractor: Function to extract total count from response
+            page_size: Number of items per page
+            prefetch: Whether to fetch the next page while the current one is consumed
+            
+        Yields:
+            List[T]: Items from each page of the endpoint
+        """
         # Initialize default extractors if not provided
         if result_extractor is None:
             result_extractor = extract_items_auto
@@ -49,8 +127,8 @@ class PaginatedFetcher:
         if total_extractor is None:
             total_extractor = extract_total_auto
         
-        # Initialize collection and pagination variables
-        all_items = []
+        # Initialize pagination variables
+        fetched = 0
         offset = 0
         total = None
         
@@ -65,44 +143,75 @@ class PaginatedFetcher:
             else nullcontext()
         )
         
+        # Single worker fetching the next page ahead of the caller, if enabled
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        next_page: Optional[Future] = None
+        
         with progress_context as progress_data:
             progress, task = progress_data if progress_data else (None, None)
             
-            # Continue fetching until we have all items
-            while True:
-                # Update offset for pagination
-                page_params = params.copy()
-                page_params["offset"] = offset
-                
-                # Fetch a page of items
-                response = self.client.get(endpoint, params=page_params)
-                
-                # Extract items and total from the response
-                page_items = result_extractor(response)
-                page_total = total_extractor(response)
-                
-                # Update total if not set yet
-                if total is None:
-                    total = page_total
-                    # Update progress total if we have a progress bar
+            try:
+                # Continue fetching until we have all items
+                while True:
+                    # Fetch a page of items, unless it was already prefetched
+                    if next_page is not None:
+                        response = next_page.result()
+                        next_page = None
+                    else:
+                        response = self._get_page(endpoint, params, offset)
+                    
+                    # Extract items and total from the response
+                    page_items = result_extractor(response)
+                    page_total = total_extractor(response)
+                    
+                    # Update total if not set yet
+                    if total is None:
+                        total = page_total
+                        # Update progress total if we have a progress bar
+                        if progress and task:
+                            progress.update(task, total=total)
+                    
+                    fetched += len(page_items)
+                    
+                    # Update progress if we have a progress bar
                     if progress and task:
-                        progress.update(task, total=total)
-                
-                # Add items to our collection
-                all_items.extend(page_items)
-                
-                # Update progress if we have a progress bar
-                if progress and task:
-                    progress.update(task, completed=len(all_items))
-                
-                # Check if we've fetched all items
-                if len(all_items) >= total or not page_items:
-                    break
-                
-                # Update offset for next page
-                offset += page_size
+                        progress.update(task, completed=fetched)
+                    
+                    # Check if we've fetched all items
+                    done = fetched >= total or not page_items
+                    
+                    # Update offset for next page
+                    offset += page_size
+                    
+                    # Request the next page before handing this one to the caller
+                    if executor is not None and not done:
+                        next_page = executor.submit(self._get_page, endpoint, params, offset)
+                    
+                    yield page_items
+                    
+                    if done:
+                        break
+            finally:
+                # Don't leave a prefetch running if the caller stopped early
+                if next_page is not None:
+                    next_page.cancel()
+                if executor is not None:
+                    executor.shutdown(wait=False)
+    
+    def _get_page(self, endpoint: str, params: Dict, offset: int) -> Any:
+        """Fetch a single page of a paginated endpoint.
         
-        return all_items
+        Args:
+            endpoint: API endpoint path
+            params: Base parameters, including the page size
+            offset: Offset of the first item on the page
+            
+        Returns:
+            Any: API response for the page
+        """
+        page_params = params.copy()
+        page_params["offset"] = offset
+        return self.client.get(endpoint, params=page_params)
 
 
 # Helper functions for extracting data from API responses
@@ -1,5 +1,46 @@
 """Utilities for filtering API resources."""
-from typing import Any, Callable, Dict, List, Optional, Set, Union
+from typing import AbstractSet, Any, Callable, Dict, FrozenSet, List, Optional, Set, Union
+
+
+def parse_id_set(ids: Optional[str]) -> Optional[FrozenSet[str]]:
+    """
+    Parse a comma-separated list of IDs into a set.
+    
+    Args:
+        ids: Comma-separated list of IDs
+        
+    Returns:
+        Optional[FrozenSet[str]]: Set of IDs, or None if no IDs were given
+    """
+    if not ids:
+        return None
+    return frozenset(id.strip() for id in ids.split(","))
+
+
+def filter_by_id_sets(items: List[Dict],
+                      include_ids: Optional[AbstractSet[str]] = None,
+                      exclude_ids: Optional[AbstractSet[str]] = None,
+                      id_field: str = "id") -> List[Dict]:
+    """
+    Filter a list of items by pre-parsed sets of IDs in a single pass.
+    
+    Args:
+        items: List of items to filter
+        include_ids: IDs to include, or None to include all
+        exclude_ids: IDs to exclude, or None to exclude none
+        id_field: Field name containing the ID in each item
+        
+    Returns:
+        List[Dict]: Filtered items
+    """
+    if include_ids is None and exclude_ids is None:
+        return items
+    
+    return [
+        item for item in items
+        if (include_ids is None or item.get(id_field) in include_ids)
+        and (exclude_ids is None or item.get(id_field) not in exclude_ids)
+    ]
 
 
 def filter_by_ids(items: List[Dict], 
@@ -18,19 +59,9 @@ def filter_by_ids(items: List[Dict],
     Returns:
         List[Dict]: Filtered items
     """
-    filtered = items
-    
-    # Filter by included IDs if specified
-    if include_ids:
-        ids = set(id.strip() for id in include_ids.split(","))
-        filtered = [item for item in filtered if item.get(id_field) in ids]
-    
-    # Filter by excluded IDs if specified
-    if exclude_ids:
-        ids = set(id.strip() for id in exclude_ids.split(","))
-        filtered = [item for item in filtered if item.get(id_field) not in ids]
-    
-    return filtered
+    return filter_by_id_sets(
+        items, parse_id_set(include_ids), parse_id_set(exclude_ids), id_field
+    )
 
 
 def filter_by_types(items: List[Dict],
@@ -0,0 +1,59 @@
+"""Rate limiting utilities for pacing API requests."""
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting how often requests may be sent.
+
+    Tokens are refilled continuously at the configured rate, up to the
+    bucket's capacity. Each request takes a token, waiting for one to be
+    refilled if the bucket is empty, so bursts up to the capacity are
+    allowed while the sustained rate never exceeds the limit.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Initialize the bucket, starting full.
+
+        Args:
+            rate: Tokens refilled per second
+            capacity: Maximum number of tokens held (defaults to one second's
+                worth, and at least one)
+
+        Raises:
+            ValueError: If rate or capacity is not positive
+        """
+        if rate <= 0:
+            raise ValueError("Rate limit must be positive")
+        if capacity is None:
+            capacity = max(1.0, rate)
+        if capacity <= 0:
+            raise ValueError("Rate limit capacity must be positive")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Take tokens from the bucket, blocking until they are available.
+
+        Args:
+            tokens: Number of tokens to take
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+
+                wait = (tokens - self._tokens) / self.rate
+
+            # Sleep without holding the lock so other threads can refill too
+            time.sleep(wait)
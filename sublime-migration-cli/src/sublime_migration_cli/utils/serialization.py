@@ -0,0 +1,91 @@
+"""JSON serialization helpers for the Sublime Migration CLI."""
+import hashlib
+import json
+from typing import Any, Callable, Optional, Union
+
+# orjson is an optional speedup; fall back to the standard library without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Whether the faster orjson backend is available
+HAS_ORJSON = orjson is not None
+
+# Size in bytes of the digests returned by content_digest
+DIGEST_SIZE = 16
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Uses orjson when it is installed, otherwise the standard library.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Any: Deserialized data
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False,
+               default: Optional[Callable[[Any], Any]] = None,
+               sort_keys: bool = False) -> bytes:
+    """
+    Serialize data to a UTF-8 encoded JSON document.
+
+    Uses orjson when it is installed, otherwise the standard library. Both
+    backends hand dataclasses to default rather than serializing them
+    directly, and accept non-string dict keys.
+
+    Args:
+        obj: Data to serialize
+        indent: Whether to indent the document by two spaces
+        default: Function converting objects that aren't natively serializable
+        sort_keys: Whether to sort dict keys, making the output canonical
+
+    Returns:
+        bytes: Serialized JSON document
+
+    Raises:
+        TypeError: If the data is not JSON serializable
+    """
+    if orjson is not None:
+        option = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=option)
+    return json.dumps(
+        obj, indent=2 if indent else None, default=default, sort_keys=sort_keys
+    ).encode("utf-8")
+
+
+def content_digest(obj: Any) -> bytes:
+    """
+    Compute a compact digest of JSON data for equality checks.
+
+    Data with equal contents has equal digests regardless of dict key order,
+    so a digest can be kept in place of data that is only needed for a later
+    comparison. Digests are only comparable within a single process, as the
+    serialization backend may differ between installations.
+
+    Args:
+        obj: JSON serializable data
+
+    Returns:
+        bytes: BLAKE2b digest of the canonical JSON serialization
+
+    Raises:
+        TypeError: If the data is not JSON serializable
+    """
+    return hashlib.blake2b(json_dumps(obj, sort_keys=True), digest_size=DIGEST_SIZE).digest()